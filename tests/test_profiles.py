@@ -0,0 +1,51 @@
+import logging
+import threading
+from types import MethodType, SimpleNamespace
+
+from vmcompact import sim
+from vmcompact.app import App
+from vmcompact.capabilities import Capabilities
+from vmcompact.data import _base_values
+from vmcompact.menu import Menus
+from vmcompact.writer import Writer
+
+
+def make_menu(vm):
+    """the parts of App and Menus used by apply_changes, the writer is flushed by hand"""
+    capabilities = Capabilities()
+    capabilities.build(vm)
+    app = SimpleNamespace(
+        target=vm,
+        capabilities=capabilities,
+        writer=Writer(rate=1),
+        _dirty={'pdirty': False},
+        _profiles_pending=0,
+        _profile_resume=False,
+        _profile_lock=threading.Lock(),
+    )
+    app.profile_started = MethodType(App.profile_started, app)
+    app.profile_applied = MethodType(App.profile_applied, app)
+    menu = SimpleNamespace(parent=app, target=vm, logger=logging.getLogger(__name__))
+    return menu, app
+
+
+def test_overlapping_profile_loads_resume_updates():
+    with sim.api('potato', seed=0) as vm:
+        menu, app = make_menu(vm)
+        _base_values.run_update = True
+        try:
+            Menus.apply_changes(menu, {'strip-0': {'gain': -10.0}})
+            # the first batch is still queued when the second load starts
+            Menus.apply_changes(menu, {'strip-1': {'gain': -20.0}})
+            assert app._profiles_pending == 2
+            assert not _base_values.run_update
+
+            app.writer.flush()
+
+            assert app._profiles_pending == 0
+            assert _base_values.run_update
+            assert app._dirty['pdirty']
+            assert vm.strip[0].gain == -10.0
+            assert vm.strip[1].gain == -20.0
+        finally:
+            _base_values.run_update = False
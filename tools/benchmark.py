@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+End-to-end UI benchmark for voicemeeter-compact.
+Drives the app of each kind against the simulated Voicemeeter (vmcompact.sim)
+and prints time to first paint, UI operation and notify -> widget latencies,
+CPU use and peak RSS as JSON.
+
+Needs a display, on Linux without one run it under Xvfb:
+    xvfb-run -a python tools/benchmark.py --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+KINDS = ['basic', 'banana', 'potato']
+
+# options passed on to the per kind child processes
+FORWARDED = ('repeat', 'samples', 'interval', 'duration', 'pdirty', 'ldirty', 'seed')
+
+
+def summarise(samples):
+    """count, mean and percentiles (in ms) of durations in seconds"""
+    if not samples:
+        return {'count': 0}
+    ms = sorted(sample * 1000 for sample in samples)
+
+    def percentile(p):
+        return round(ms[min(len(ms) - 1, round(p / 100 * (len(ms) - 1)))], 3)
+
+    return {
+        'count': len(ms),
+        'mean': round(statistics.fmean(ms), 3),
+        'p50': percentile(50),
+        'p95': percentile(95),
+        'p99': percentile(99),
+        'max': round(ms[-1], 3),
+    }
+
+
+def peak_rss_kb():
+    """peak resident set size of this process in KiB, None where unsupported"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def toggle_config(channel):
+    """opens or closes the config frame of a channel, as its CONFIG button would"""
+    if hasattr(channel, 'toggle_conf'):
+        channel.toggle_conf()
+    else:
+        channel.builder.button_conf.invoke()
+
+
+class Benchmark:
+    """
+    Runs the scenario of a single kind on the Tk thread.
+
+    Each step of the scenario is a generator yielding the delay (in ms)
+    before the next step, so the app keeps processing events in between.
+    """
+
+    def __init__(self, app, vm, args, started):
+        self.app = app
+        self.vm = vm
+        self.args = args
+        self.started = started
+        self.samples = {}
+        self.results = {'kind': app.kind.name}
+        self._random = random.Random(args.seed)
+        self._steps = self.steps()
+
+    def first_paint(self):
+        self.results['first_paint_ms'] = round(
+            (time.perf_counter() - self.started) * 1000, 1
+        )
+        self.app.after(500, self.step)
+
+    def step(self):
+        try:
+            delay = next(self._steps)
+        except StopIteration:
+            self.finish()
+            return
+        except Exception:
+            self.results['error'] = traceback.format_exc()
+            self.finish()
+            return
+        self.app.after(delay, self.step)
+
+    def finish(self):
+        self.results['operations'] = {
+            name: summarise(samples) for name, samples in self.samples.items()
+        }
+        self.results['peak_rss_kb'] = peak_rss_kb()
+        self.app.on_close_window()
+
+    def timed(self, name, fn, *args):
+        """times a UI operation, including the redraws it causes"""
+        start = time.perf_counter()
+        fn(*args)
+        self.app.update_idletasks()
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+
+    def steps(self):
+        from vmcompact.data import _configuration
+
+        self.results['renderer'] = _configuration.renderer
+        yield from self.views()
+        yield from self.config_frames()
+        yield from self.profiles()
+        yield from self.latency()
+        yield from self.load('idle', 0, 0)
+        yield from self.load('load', self.args.pdirty, self.args.ldirty)
+
+    def views(self):
+        nav = self.app.nav_frame
+        if nav.extend.get():
+            nav.extend_button.invoke()
+            yield 100
+        for _ in range(self.args.repeat):
+            for _ in range(2):
+                self.timed('switch_channel', nav.channel_button.invoke)
+                yield 20
+        for _ in range(self.args.repeat):
+            for _ in range(2):
+                self.timed('extend_frame', nav.extend_button.invoke)
+                yield 20
+        if self.app.kind.name == 'potato':
+            nav.extend_button.invoke()
+            yield 100
+            for _ in range(self.args.repeat):
+                for _ in range(2):
+                    self.timed('show_submix', nav.submix_button.invoke)
+                    yield 20
+            nav.extend_button.invoke()
+            yield 100
+
+    def config_frames(self):
+        nav = self.app.nav_frame
+        nav.extend_button.invoke()
+        yield 100
+        for kind in ('strip', 'bus'):
+            frame = getattr(self.app, f'{kind}_frame')
+            channels = [channel for channel in frame.labelframes if channel.visible]
+            for _ in range(self.args.repeat):
+                for channel in channels:
+                    self.timed(f'open_config_{kind}', toggle_config, channel)
+                    yield 20
+                    self.timed(f'close_config_{kind}', toggle_config, channel)
+                    yield 20
+        nav.extend_button.invoke()
+        yield 100
+
+    def scramble(self):
+        """changes the gain and mute of every channel so a profile has work to do"""
+        for channel in self.vm.strip + self.vm.bus:
+            channel.gain = round(self._random.uniform(-60, 12), 1)
+            channel.mute = self._random.random() < 0.5
+
+    def profiles(self):
+        from vmcompact.data import _base_values
+
+        names = ['reset', *(name for name in self.app.userconfigs if name != 'reset')]
+        self.results['profiles'] = names
+        for _ in range(self.args.repeat):
+            for name in names:
+                self.scramble()
+                yield 100
+                start = time.perf_counter()
+                self.app.menu.load_profile(name)
+                # applied once updates resume and the UI has synced
+                while not _base_values.run_update or self.app._dirty['pdirty']:
+                    if time.perf_counter() - start > 5:
+                        raise TimeoutError(f'profile {name} was not applied')
+                    yield 1
+                self.samples.setdefault('load_profile', []).append(
+                    time.perf_counter() - start
+                )
+
+    def latency(self):
+        """time from a parameter change in the interface to its channel's widget"""
+        channel = next(
+            channel for channel in self.app.strip_frame.labelframes if channel.visible
+        )
+        target = self.vm.strip[channel.index]
+        on_state = channel.on_state
+        samples = self.samples.setdefault('notify_to_widget', [])
+        pending = {}
+
+        def timed_on_state(field, value):
+            on_state(field, value)
+            if field == 'gain' and (start := pending.pop(value, None)) is not None:
+                samples.append(time.perf_counter() - start)
+
+        # the store holds the bound method, swap its subscription
+        self.app.store.unsubscribe(channel.state, ('gain',), on_state)
+        self.app.store.subscribe(channel.state, ('gain',), timed_on_state)
+        try:
+            for i in range(self.args.samples):
+                value = -10.0 if i % 2 else -20.0
+                pending.clear()
+                pending[value] = time.perf_counter()
+                target.gain = value
+                yield self.args.interval
+        finally:
+            self.app.store.unsubscribe(channel.state, ('gain',), timed_on_state)
+            self.app.store.subscribe(channel.state, ('gain',), on_state)
+        self.results['notify_to_widget_missed'] = self.args.samples - len(samples)
+
+    def load(self, name, pdirty, ldirty):
+        """CPU seconds used per second of wall time at the given event rates"""
+        self.vm.pdirty_rate, self.vm.ldirty_rate = pdirty, ldirty
+        yield 500
+        wall, cpu = time.perf_counter(), time.process_time()
+        yield round(self.args.duration * 1000)
+        self.results.setdefault('cpu_per_second', {})[name] = {
+            'pdirty_rate': pdirty,
+            'ldirty_rate': ldirty,
+            'cpu': round((time.process_time() - cpu) / (time.perf_counter() - wall), 4),
+        }
+
+
+def run_kind(kind_id, args) -> dict:
+    """runs the scenario of a kind in this process"""
+    started = time.perf_counter()
+    sys.path.insert(0, str(ROOT))
+
+    import vmcompact
+    from vmcompact import sim
+
+    with sim.api(kind_id, ldirty_rate=args.ldirty, seed=args.seed) as vm:
+        app = vmcompact.connect(kind_id, vm)
+        benchmark = Benchmark(app, vm, args, started)
+        # idle callbacks run after pending redraws, so this marks the first paint
+        app.after_idle(app.after_idle, benchmark.first_paint)
+        app.mainloop()
+    benchmark.results['interface_calls'] = vm.calls
+    return benchmark.results
+
+
+def spawn(kind_id, args) -> dict:
+    """runs a kind in a fresh process, so startup and peak RSS are its own"""
+    cmd = [sys.executable, __file__, '--child', kind_id]
+    for option in FORWARDED:
+        cmd += [f'--{option}', str(getattr(args, option))]
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT)
+    if proc.returncode or not proc.stdout.strip():
+        return {'kind': kind_id, 'error': proc.stderr.strip()[-2000:]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def app_version():
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        return None
+    try:
+        return version('voicemeeter-compact')
+    except PackageNotFoundError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the voicemeeter-compact UI against a simulated Voicemeeter'
+    )
+    parser.add_argument('--kinds', nargs='+', choices=KINDS, default=KINDS)
+    parser.add_argument(
+        '--repeat', type=int, default=10, help='repetitions of each UI operation'
+    )
+    parser.add_argument(
+        '--samples', type=int, default=200, help='notify -> widget latency samples'
+    )
+    parser.add_argument(
+        '--interval',
+        type=int,
+        default=50,
+        help='ms between latency samples (default: 50)',
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=5,
+        help='seconds of each CPU measurement (default: 5)',
+    )
+    parser.add_argument(
+        '--pdirty', type=float, default=50, help='pdirty rate (Hz) under load'
+    )
+    parser.add_argument(
+        '--ldirty', type=float, default=60, help='ldirty rate (Hz) under load'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help='write JSON here, not stdout')
+    parser.add_argument('--child', choices=KINDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_kind(args.child, args)))
+        return
+
+    if sys.platform.startswith('linux') and not os.environ.get('DISPLAY'):
+        parser.error(
+            'no display, run under Xvfb: xvfb-run -a python tools/benchmark.py'
+        )
+
+    results = {
+        'version': app_version(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'options': {option: getattr(args, option) for option in FORWARDED},
+        'kinds': {},
+    }
+    for kind_id in args.kinds:
+        print(f'benchmarking {kind_id}...', file=sys.stderr)
+        results['kinds'][kind_id] = spawn(kind_id, args)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + '\n')
+    else:
+        print(output)
+    if any('error' in result for result in results['kinds'].values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the voicemeeter-compact hot paths.
+Times the observer registry, parameter getters/setters, label syncing and
+level mapping in isolation, against stub frames and the simulated Voicemeeter.
+No display is needed.
+
+    python tools/microbench.py
+    python tools/microbench.py --filter levels --json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from vmcompact import levels, sim, util  # noqa: E402
+from vmcompact.canvas import Value  # noqa: E402
+from vmcompact.capabilities import Capabilities  # noqa: E402
+from vmcompact.channels import ChannelFrame, ChannelLabelFrame  # noqa: E402
+from vmcompact.config import Config  # noqa: E402
+from vmcompact.store import Store  # noqa: E402
+from vmcompact.subject import Subject  # noqa: E402
+from vmcompact.writer import Writer  # noqa: E402
+
+BENCHMARKS = {}
+
+
+def bench(name):
+    """registers a setup function, it returns the callable to be timed"""
+
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+def noop(*args, **kwargs):
+    pass
+
+
+def make_app(kind_id='potato'):
+    """the parts of App used by the benchmarked code, pointed at a simulated remote"""
+    vm = sim.api(kind_id, labels=True, seed=0)
+    capabilities = Capabilities()
+    capabilities.build(vm)
+    app = SimpleNamespace(
+        kind=vm.kind,
+        target=vm,
+        capabilities=capabilities,
+        # never started, put() only queues
+        writer=Writer(rate=1),
+        subject=Subject(),
+        target_generation=0,
+    )
+    app.store = Store(app)
+    app.store.build(vm.kind)
+    return app
+
+
+class Observer:
+    topics = ('pdirty', 'ldirty')
+
+    def on_update(self, subject):
+        pass
+
+
+class ChannelStub:
+    """a strip labelframe without Tk, using the real ChannelLabelFrame methods"""
+
+    params = ChannelLabelFrame.params
+    getter = ChannelLabelFrame.getter
+    set_level = ChannelLabelFrame.set_level
+    build = ChannelLabelFrame.build
+    subscribe = ChannelLabelFrame.subscribe
+    on_state = ChannelLabelFrame.on_state
+    sync_labels = ChannelLabelFrame.sync_labels
+    level_muted = ChannelLabelFrame.level_muted
+    grid = grid_remove = configure = noop
+
+    def __init__(self, app, frame, index):
+        self.app = app
+        self.parent = frame
+        self.index = index
+        self.id = 'strip'
+        self.identifier = 'strip'
+        self.target = app.target.strip[index]
+        self.state = app.store.strip[index]
+        self.styletable = SimpleNamespace(configure=noop)
+        self.visible = True
+        # no widgets to build
+        self.built = True
+        self._level = 0
+        self.level = Value(0)
+        self.gain = Value(0.0)
+        self.gainlabel = Value(0.0)
+        self.mute = Value(False)
+
+    @property
+    def level_gain(self):
+        return self.state.gain or 0
+
+
+class ChannelFrameStub:
+    """a strip frame without Tk, using the real ChannelFrame.upd_levels"""
+
+    upd_levels = ChannelFrame.upd_levels
+    columnconfigure = noop
+
+    def __init__(self, app):
+        self.parent = app
+        self.identifier = 'strip'
+        self.channels = tuple(
+            ChannelStub(app, self, i) for i, _ in enumerate(app.target.strip)
+        )
+        [channel.subscribe() for channel in self.channels]
+        phys_in = app.kind.phys_in
+        self.level_offsets = [
+            i * 2 if i < phys_in else phys_in * 2 + (i - phys_in) * 8
+            for i, _ in enumerate(self.channels)
+        ]
+
+
+class ConfigStub:
+    """a strip config frame without Tk, using the real Config methods"""
+
+    resolve = Config.resolve
+    getter = Config.getter
+    setter = Config.setter
+
+    def __init__(self, app, index):
+        self.app = app
+        self.identifier = 'strip'
+        self.index = index
+        self.target = app.target.strip[index]
+
+
+@bench('subject.notify (20 observers)')
+def subject_notify():
+    subject = Subject()
+    [subject.add(Observer()) for _ in range(20)]
+    return lambda: subject.notify('pdirty')
+
+
+@bench('subject.notify (no observers)')
+def subject_notify_empty():
+    subject = Subject()
+    return lambda: subject.notify('labelframe')
+
+
+@bench('subject.add/remove')
+def subject_add_remove():
+    subject = Subject()
+    [subject.add(Observer()) for _ in range(20)]
+    observer = Observer()
+
+    def fn():
+        subject.add(observer)
+        subject.remove(observer)
+
+    return fn
+
+
+@bench('capabilities.supports')
+def capabilities_supports():
+    app = make_app()
+    strip = app.target.strip[0]
+    return lambda: app.capabilities.supports(strip, 'mute')
+
+
+@bench('dir() guard (baseline)')
+def dir_guard():
+    strip = make_app().target.strip[0]
+    return lambda: 'mute' in dir(strip)
+
+
+@bench('channel.getter')
+def channel_getter():
+    app = make_app()
+    channel = ChannelFrameStub(app).channels[0]
+    return lambda: channel.getter('gain')
+
+
+@bench('config.getter comp.knob')
+def config_getter():
+    config = ConfigStub(make_app(), 0)
+    return lambda: config.getter('comp.knob')
+
+
+@bench('config.setter comp.knob')
+def config_setter():
+    config = ConfigStub(make_app(), 0)
+    return lambda: config.setter('comp.knob', 5.0)
+
+
+@bench('util.get_busmode_fullnames')
+def busmode_fullnames():
+    kind = sim.kinds['potato']
+    return lambda: util.get_busmode_fullnames(kind)
+
+
+@bench('util.get_busmode_fullnames_reversed')
+def busmode_fullnames_reversed():
+    kind = sim.kinds['potato']
+    return lambda: util.get_busmode_fullnames_reversed(kind)
+
+
+@bench('sync_labels')
+def sync_labels():
+    channel = ChannelFrameStub(make_app()).channels[0]
+    label = channel.state.label
+    return lambda: channel.sync_labels(label)
+
+
+@bench('store.refresh (unchanged)')
+def store_refresh_unchanged():
+    app = ChannelFrameStub(make_app()).parent
+    return app.store.refresh
+
+
+@bench('store.refresh (one gain changed)')
+def store_refresh_changed():
+    app = ChannelFrameStub(make_app()).parent
+    strip = app.target.strip[0]
+
+    def fn():
+        strip.gain = -10.0 if strip.gain == -20.0 else -20.0
+        app.store.refresh()
+
+    return fn
+
+
+@bench('levels.read strip prefader')
+def levels_read():
+    app = make_app()
+    app.strip_frame = app.bus_frame = app.submix_frame = None
+    pipeline = levels.LevelPipeline(app)
+    return lambda: pipeline._read(app.target.strip, 'prefader')
+
+
+@bench('levels.peaks + to_display')
+def levels_to_display():
+    frame = ChannelFrameStub(make_app())
+    strip = levels.LevelPipeline(frame.parent)._read(
+        frame.parent.target.strip, 'prefader'
+    )
+    gains = [0.0] * len(frame.channels)
+    muted = [False] * len(frame.channels)
+    return lambda: levels.to_display(
+        levels.peaks(strip, frame.level_offsets), gains, muted
+    )
+
+
+@bench('upd_levels (strip frame)')
+def upd_levels():
+    frame = ChannelFrameStub(make_app())
+    app = frame.parent
+    app.strip_frame = frame
+    app.bus_frame = app.submix_frame = None
+    app.levels = levels.LevelPipeline(app)
+    app.levels.refresh()
+    return frame.upd_levels
+
+
+def run(name, setup, repeat) -> dict:
+    """best and median time per call (in µs) over repeat runs"""
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    times = [t / number * 1e6 for t in timer.repeat(repeat, number)]
+    return {
+        'name': name,
+        'loops': number,
+        'best_us': round(min(times), 3),
+        'median_us': round(statistics.median(times), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Microbenchmarks for the voicemeeter-compact hot paths'
+    )
+    parser.add_argument(
+        '--filter', default='', help='only run benchmarks whose name contains this'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    results = [
+        run(name, setup, args.repeat)
+        for name, setup in BENCHMARKS.items()
+        if args.filter in name
+    ]
+    if args.json:
+        print(
+            json.dumps(
+                {'numpy': levels.numpy() is not None, 'results': results}, indent=2
+            )
+        )
+        return
+    print(f'numpy: {"yes" if levels.numpy() is not None else "no"}')
+    width = max((len(result['name']) for result in results), default=0)
+    for result in results:
+        print(
+            f'{result["name"]:<{width}}  {result["best_us"]:>10.3f} µs'
+            f'  (median {result["median_us"]:.3f} µs, {result["loops"]} loops)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,10 @@
-from .app import connect
+def __getattr__(name):
+    # the app is imported on first use so vmcompact.startup can be enabled first
+    if name == 'connect':
+        from .app import connect
+
+        return connect
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 __ALL__ = ['connect']
@@ -1,19 +1,27 @@
 import logging
+import threading
+import time
 import tkinter as tk
 from functools import cached_property
 from pathlib import Path
 from tkinter import messagebox, ttk
 from typing import NamedTuple
 
-import voicemeeterlib
-from voicemeeterlib import kinds
-
+from . import startup
 from .builders import MainFrameBuilder
-from .configurations import loader
-from .data import _base_values, _configuration, get_configuration
+from .capabilities import Capabilities
+from .configurations import get_configpath, get_profilepath, loader, snapshot
+from .data import _base_values, _configuration
 from .errors import VMCompactError
+from .health import HealthMonitor
+from .levels import LevelPipeline
 from .menu import Menus
+from .pool import FramePool
+from .stats import NotifyStats
+from .store import Store
 from .subject import Subject
+from .watchdog import Watchdog
+from .writer import Writer
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +49,37 @@ class App(tk.Tk):
     def __init__(self, vmr, theme):
         super().__init__()
         self.logger = logger.getChild(self.__class__.__name__)
+        self.watchdog = None
+        if _configuration.watchdog:
+            self.watchdog = Watchdog(
+                self,
+                _configuration.watchdog_threshold / 1000,
+                _configuration.watchdog_logfile,
+            )
+            self.watchdog.install()
         self._vmr = vmr
         self._vmr.event.add(['pdirty', 'ldirty'])
         self.subject = Subject()
+        if _configuration.stats:
+            self.subject.stats = NotifyStats(_configuration.stats_window)
+        self._dirty = {'pdirty': False, 'ldirty': False, 'health': False}
+        self.levels = LevelPipeline(self)
+        self.store = Store(self)
+        # read once per frame before the observers of a topic are notified
+        self._sources = {'pdirty': self.store, 'ldirty': self.levels}
+        self.health = HealthMonitor(self.probe, self.on_health)
+        self.writer = Writer(_configuration.write_rate, on_error=self.health.suspect)
+        self.writer.start()
+        # profile batches queued on the writer, run_update is restored after the last
+        self._profiles_pending = 0
+        self._profile_resume = False
+        self._profile_lock = threading.Lock()
+        self.capabilities = Capabilities()
+        self.target_generation = 0
+        self.pool = FramePool(_configuration.pool_size)
+        self._frame_ms = max(1, round(1000 / max(1, _configuration.update_rate)))
+        # set while updates wait for a Voicemeeter launched by the API
+        self._awaiting_ready = False
         self.start_updates()
         self._vmr.init_thread()
         for pn in (
@@ -56,17 +92,41 @@ class App(tk.Tk):
         self.minsize(275, False)
         self._configs = None
         self.protocol('WM_DELETE_WINDOW', self.on_close_window)
-        self.menu = self['menu'] = Menus(self, vmr)
+        with startup.measure('menus'):
+            self.menu = self['menu'] = Menus(self, vmr)
         self.styletable = ttk.Style()
         if _configuration.config:
-            vmr.apply_config(_configuration.config)
+            with startup.measure('apply config'):
+                vmr.apply_config(_configuration.config)
 
-        self.build_app()
+        with startup.measure('build app'):
+            self.build_app()
 
         self.drag_id = ''
         self.bind('<Configure>', self.dragging)
 
-        self.after(1, self.healthcheck_step)
+        self._mapped = True
+        self._obscured = False
+        self._focused = True
+        self._levels_at = 0
+        self.bind('<Map>', self.on_map)
+        self.bind('<Unmap>', self.on_unmap)
+        self.bind('<Visibility>', self.on_visibility)
+        self.bind('<FocusIn>', self.on_focus)
+        self.bind('<FocusOut>', self.on_focus)
+
+        self._prompting = False
+        self._recovering = False
+        self.health.start()
+        if self.watchdog:
+            self.watchdog.start()
+        self.after(1, self.dispatch_step)
+        if _configuration.watch_interval > 0:
+            self._watched = self.watch_snapshot()
+            self.after(round(_configuration.watch_interval * 1000), self.watch_step)
+        if startup.enabled():
+            # idle callbacks run after pending redraws, so this marks the first paint
+            self.after_idle(self.after_idle, startup.report)
 
     def __str__(self):
         return f'{type(self).__name__}App'
@@ -97,6 +157,9 @@ class App(tk.Tk):
 
         # register event callbacks
         self.target.subject.add([self.on_pdirty, self.on_ldirty])
+        self.invalidate_targets()
+        self.capabilities.build(self.target)
+        self.store.build(self.kind)
 
         self.bus_frame = None
         self.submix_frame = None
@@ -111,13 +174,138 @@ class App(tk.Tk):
         if self.kind.name == 'potato':
             self.builder.create_banner()
 
+    def profile_started(self):
+        """pauses UI sync until every queued profile batch has been sent"""
+        with self._profile_lock:
+            if not self._profiles_pending:
+                self._profile_resume = _base_values.run_update
+            self._profiles_pending += 1
+            _base_values.run_update = False
+
+    def profile_applied(self):
+        """called on the writer thread, the next frame syncs the UI once"""
+        with self._profile_lock:
+            self._profiles_pending -= 1
+            if not self._profiles_pending:
+                _base_values.run_update = self._profile_resume
+        self._dirty['pdirty'] = True
+
+    def rebind(self, vban):
+        """
+        Points the app at another vban interface of the same kind.
+
+        Frames are kept, they re-resolve their targets and sync on the next frame.
+        """
+        self.target.subject.remove([self.on_pdirty, self.on_ldirty])
+        self._vban = vban
+        _base_values.vban_connected = True
+        self.builder.set_title()
+        self.target.subject.add([self.on_pdirty, self.on_ldirty])
+        self.invalidate_targets()
+        self.capabilities.build(self.target)
+        self._dirty['pdirty'] = True
+        self.subject.notify('submix')
+
+    def invalidate_targets(self):
+        """forces every channel to re-resolve its cached interface object and resync"""
+        self.target_generation += 1
+        self.store.invalidate()
+
     def on_pdirty(self):
         if _base_values.run_update:
-            self.after(1, self.subject.notify, 'pdirty')
+            self._dirty['pdirty'] = True
 
     def on_ldirty(self):
         if not _base_values.dragging:
-            self.after(1, self.subject.notify, 'ldirty')
+            self._dirty['ldirty'] = True
+
+    def dispatch_step(self):
+        """
+        Notifies observers of any dirty flags raised since the last frame.
+
+        Events fired by the interface thread only raise a flag, so each topic
+        is dispatched at most once per frame regardless of the event rate.
+        An error in one topic is logged, it does not stop the others or the next frame.
+        """
+        for modifier, dirty in self._dirty.items():
+            if dirty:
+                try:
+                    self.dispatch(modifier)
+                except Exception:
+                    self.logger.exception(f'error dispatching {modifier}')
+        self.after(self._frame_ms, self.dispatch_step)
+
+    def dispatch(self, modifier):
+        if modifier == 'health':
+            self._dirty[modifier] = False
+            self.health_changed()
+            return
+        if modifier == 'ldirty' and not self.levels_due():
+            return
+        self._dirty[modifier] = False
+        self.refresh_source(modifier)
+        self.subject.notify(modifier)
+
+    def refresh_source(self, modifier):
+        """reads the store or the levels in a single pass, timed while stats are on"""
+        source = self._sources[modifier]
+        if self.subject.stats is None:
+            source.refresh()
+            return
+        start = time.perf_counter()
+        source.refresh()
+        self.subject.stats.record(modifier, source, time.perf_counter() - start)
+
+    def levels_due(self) -> bool:
+        """
+        Throttles level processing according to the visibility of the window.
+
+        Hidden or fully obscured: no processing.
+        Unfocused: processed at background_rate (0 disables).
+        """
+        if not self._mapped or self._obscured:
+            return False
+        if not self._focused:
+            if not _configuration.background_rate:
+                return False
+            now = time.monotonic()
+            if now - self._levels_at < 1 / _configuration.background_rate:
+                return False
+            self._levels_at = now
+        return True
+
+    def on_map(self, event):
+        if event.widget is self and not self._mapped:
+            self.logger.debug('window mapped, resuming level updates')
+            self._mapped = True
+            self.target.event.add('ldirty')
+            self._dirty['ldirty'] = True
+
+    def on_unmap(self, event):
+        if event.widget is self and self._mapped:
+            self.logger.debug('window unmapped, pausing level updates')
+            self._mapped = False
+            self.target.event.remove('ldirty')
+
+    def on_visibility(self, event):
+        if event.widget is self:
+            self._obscured = event.state == 'VisibilityFullyObscured'
+            if not self._obscured:
+                self._dirty['ldirty'] = True
+
+    def on_focus(self, event):
+        """focus may move between child widgets, so check the app as a whole"""
+        self.after_idle(self.update_focus)
+
+    def update_focus(self):
+        try:
+            focused = self.focus_get() is not None
+        except KeyError:
+            # focus_get fails for widgets tkinter does not know about (menus)
+            focused = True
+        if focused and not self._focused:
+            self._dirty['ldirty'] = True
+        self._focused = focused
 
     def _destroy_top_level_frames(self):
         """
@@ -129,6 +317,8 @@ class App(tk.Tk):
         """
         self.target.subject.remove([self.on_pdirty, self.on_ldirty])
         self.subject.clear()
+        self.store.clear()
+        self.pool.clear()
         [
             frame.destroy()
             for frame in self.winfo_children()
@@ -152,61 +342,110 @@ class App(tk.Tk):
         self._configs = loader(self.kind.name, self.target)
         return self._configs
 
-    def start_updates(self):
-        def init():
-            self.logger.debug('updates started')
-            _base_values.run_update = True
+    def watch_snapshot(self):
+        """stamps of the top level configs and the profiles of the current kind"""
+        if configpath := get_configpath():
+            return snapshot(configpath), snapshot(get_profilepath(self.kind.name))
+        return {}, {}
+
+    def watch_step(self):
+        """reloads profiles and vban.toml when the config directory changes"""
+        configs, profiles = watched = self.watch_snapshot()
+        if watched != self._watched:
+            if configs != self._watched[0]:
+                self.menu.reload_configs()
+            if profiles != self._watched[1]:
+                self.logger.debug('profiles changed on disk, reloading')
+                self.menu.reload_profiles()
+            self._watched = watched
+        self.after(round(_configuration.watch_interval * 1000), self.watch_step)
 
-        if self._vmr.gui.launched_by_api:
+    def start_updates(self):
+        """starts updates, once Voicemeeter is ready if the API launched it"""
+        if self._vmr.gui.launched_by_api and self.health.state != HealthMonitor.READY:
+            self._awaiting_ready = True
             self.subject.notify('pdirty')
-            self.after(12000, init)
-        else:
-            init()
+            return
+        self._awaiting_ready = False
+        self.logger.debug('updates started')
+        _base_values.run_update = True
 
-    def healthcheck_step(self):
+    def probe(self):
+        """called by the health monitor, raises if Voicemeeter is unreachable"""
         if not _base_values.vban_connected:
+            self._vmr.version
+
+    def on_health(self, state):
+        """called on the health monitor thread, the change is handled next frame"""
+        self._dirty['health'] = True
+
+    def health_changed(self):
+        if self._prompting:
+            self._dirty['health'] = True
+            return
+
+        if self.health.state == HealthMonitor.READY:
+            if self._recovering:
+                self.logger.debug('voicemeeter ready, rebuilding the app.')
+                self._recovering = False
+                self._vmr.init_thread()
+                self.build_app(self._vmr.kind)
+                for i, _ in enumerate(self.menu.vban_config or ()):
+                    target = getattr(self.menu, f'menu_vban_{i + 1}')
+                    target.entryconfig(0, state='normal')
+                    target.entryconfig(1, state='disabled')
+                [
+                    self.menu.menu_vban.entryconfig(j, state='normal')
+                    for j, _ in enumerate(self.menu.menu_vban.winfo_children())
+                ]
+                self.start_updates()
+            elif self._awaiting_ready:
+                # pauses owned by profile loads and drags are left alone
+                self.start_updates()
+        elif self.health.state == HealthMonitor.LOST and not self._recovering:
+            self._prompting = True
             try:
-                self._vmr.version
-            except voicemeeterlib.error.CAPIError:
                 resp = messagebox.askyesno(message='Restart Voicemeeter GUI?')
-                if resp:
-                    self.logger.debug(
-                        'healthcheck failed, rebuilding the app after GUI restart.'
-                    )
-                    self._vmr.end_thread()
-                    self._vmr.run_voicemeeter(self._vmr.kind.name)
-                    _base_values.run_update = False
-                    self._vmr.init_thread()
-                    self.after(8000, self.start_updates)
-                    self._destroy_top_level_frames()
-                    self.build_app(self._vmr.kind)
-                    vban_config = get_configuration('vban')
-                    for i, _ in enumerate(vban_config):
-                        target = getattr(self.menu, f'menu_vban_{i + 1}')
-                        target.entryconfig(0, state='normal')
-                        target.entryconfig(1, state='disabled')
-                    [
-                        self.menu.menu_vban.entryconfig(j, state='normal')
-                        for j, _ in enumerate(self.menu.menu_vban.winfo_children())
-                    ]
-                else:
-                    self.destroy()
-        self.after(250, self.healthcheck_step)
+            finally:
+                self._prompting = False
+            if resp:
+                self.logger.debug(
+                    'healthcheck failed, rebuilding the app once the GUI is ready.'
+                )
+                self._recovering = True
+                _base_values.run_update = False
+                self._vmr.end_thread()
+                self._destroy_top_level_frames()
+                self._vmr.run_voicemeeter(self._vmr.kind.name)
+                self.health.expect_restart()
+            else:
+                self.destroy()
 
     def on_close_window(self):
+        if self.subject.stats is not None:
+            self.logger.info(f'observer timings:\n{self.subject.stats.report()}')
+        self.health.stop()
+        self.writer.stop()
+        if self.watchdog:
+            self.watchdog.stop()
+        self.menu.vban_cancel()
+        self.menu.sessions.shutdown()
         if _base_values.vban_connected:
             self._vban.logout()
+        self.menu.sessions.clear_standby()
         self.destroy()
 
 
-_apps = {kind.name: App.make(kind) for kind in kinds.all}
+_apps = {}
 
 
 def connect(kind_id: str, vmr, theme=None) -> App:
-    """return App of the kind requested"""
+    """return App of the kind requested, App classes are made on first request"""
 
+    if getattr(vmr.kind, 'name', None) != kind_id:
+        raise VMCompactError(f'Invalid kind: {kind_id}')
     try:
         VMMIN_cls = _apps[kind_id]
     except KeyError:
-        raise VMCompactError(f'Invalid kind: {kind_id}')
+        VMMIN_cls = _apps[kind_id] = App.make(vmr.kind)
     return VMMIN_cls(vmr, theme)
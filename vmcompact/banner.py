@@ -8,6 +8,8 @@ logger = logging.getLogger(__name__)
 
 
 class Banner(ttk.Frame):
+    topics = ('submix',)
+
     def __init__(self, parent):
         super().__init__()
         self.parent = parent
@@ -4,12 +4,8 @@ import tkinter as tk
 from functools import partial
 from tkinter import ttk
 
-import sv_ttk
-
 from . import util
-from .banner import Banner
 from .channels import _make_channelframe
-from .config import BusConfig, StripConfig
 from .data import _base_values, _configuration
 from .navigation import Navigation
 
@@ -37,24 +33,54 @@ class MainFrameBuilder(AbstractBuilder):
         self.logger = logger.getChild(self.__class__.__name__)
 
     def setup(self):
-        self.app.title(
-            f'Voicemeeter{self.kind}.Compact [{"Local" if not _base_values.vban_connected else "Network"} Connection]'
-        )
+        self.set_title()
         self.app.resizable(False, False)
         if _configuration.themes_enabled:
+            import sv_ttk
+
             if sv_ttk.get_theme() not in ('light', 'dark'):
                 sv_ttk.set_theme(_configuration.theme_mode)
                 self.logger.info(
                     f'Sunvalley {sv_ttk.get_theme().capitalize()} Theme applied'
                 )
 
+    def set_title(self):
+        self.app.title(
+            f'Voicemeeter{self.kind}.Compact [{"Local" if not _base_values.vban_connected else "Network"} Connection]'
+        )
+
     def create_channelframe(self, type_):
-        if type_ == 'strip':
-            self.app.strip_frame = _make_channelframe(self.app, type_)
+        key = (self.kind.name, type_, None)
+        if frame := self.app.pool.acquire(key):
+            frame.show()
+        elif _configuration.renderer == 'canvas':
+            from .canvas import CanvasChannelFrame
+
+            frame = CanvasChannelFrame(self.app, type_)
         else:
-            self.app.bus_frame = _make_channelframe(self.app, type_)
+            frame = _make_channelframe(self.app, type_)
+        frame.pool_key = key
+        setattr(self.app, f'{type_}_frame', frame)
         self.logger.info(f'Finished building channelframe type {type_}')
 
+    def create_submixframe(self):
+        key = (self.kind.name, 'submix', _configuration.submixes)
+        if frame := self.app.pool.acquire(key):
+            frame.show()
+        elif _configuration.renderer == 'canvas':
+            from .canvas import CanvasSubMixFrame
+
+            frame = CanvasSubMixFrame(self.app)
+        else:
+            from .gainlayer import SubMixFrame
+
+            frame = SubMixFrame(self.app)
+        frame.pool_key = key
+        self.app.submix_frame = frame
+        self.logger.info(
+            f'Finished building submixframe for submix {_configuration.submixes}'
+        )
+
     def create_separator(self):
         self.app.sep = ttk.Separator(self.app, orient='vertical')
         self.app.sep.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -66,18 +92,21 @@ class MainFrameBuilder(AbstractBuilder):
         self.logger.info('Finished building navframe')
 
     def create_configframe(self, type_, index, id):
+        from .config import BusConfig, StripConfig
+
         if type_ == 'strip':
             self.app.config_frame = StripConfig(self.app, index, id)
             if self.app.strip_frame:
                 [
                     frame.conf.set(False)
                     for i, frame in enumerate(self.app.strip_frame.labelframes)
-                    if i != index
+                    if i != index and frame.built
                 ]
             if self.app.bus_frame:
                 [
                     frame.conf.set(False)
                     for _, frame in enumerate(self.app.bus_frame.labelframes)
+                    if frame.built
                 ]
         else:
             self.app.config_frame = BusConfig(self.app, index, id)
@@ -85,12 +114,13 @@ class MainFrameBuilder(AbstractBuilder):
                 [
                     frame.conf.set(False)
                     for i, frame in enumerate(self.app.bus_frame.labelframes)
-                    if i != index
+                    if i != index and frame.built
                 ]
             if self.app.strip_frame:
                 [
                     frame.conf.set(False)
                     for _, frame in enumerate(self.app.strip_frame.labelframes)
+                    if frame.built
                 ]
         if not _configuration.themes_enabled:
             if self.app.strip_frame:
@@ -100,6 +130,7 @@ class MainFrameBuilder(AbstractBuilder):
                         background=f'{"white" if not frame.conf.get() else "yellow"}',
                     )
                     for _, frame in enumerate(self.app.strip_frame.labelframes)
+                    if frame.built
                 ]
             if self.app.bus_frame:
                 [
@@ -108,6 +139,7 @@ class MainFrameBuilder(AbstractBuilder):
                         background=f'{"white" if not frame.conf.get() else "yellow"}',
                     )
                     for _, frame in enumerate(self.app.bus_frame.labelframes)
+                    if frame.built
                 ]
         self.logger.info(f'Finished building configframe for {type_}[{index}]')
         self.app.after(5, self.reset_config_frames)
@@ -120,6 +152,8 @@ class MainFrameBuilder(AbstractBuilder):
         ]
 
     def create_banner(self):
+        from .banner import Banner
+
         self.app.banner = Banner(self.app)
         self.app.banner.grid(row=4, column=0, columnspan=3)
         self.logger.info('Finished building banner')
@@ -184,6 +218,7 @@ class NavigationFrameBuilder(AbstractBuilder):
         self.navframe.info_button = ttk.Checkbutton(
             self.navframe,
             textvariable=self.navframe.info_text,
+            command=self.navframe.toggle_info,
             style=f'{"Toggle.TButton" if _configuration.themes_enabled else "Rec.TButton"}',
             variable=self.navframe.info,
         )
@@ -217,12 +252,12 @@ class ChannelLabelFrameBuilder(AbstractBuilder):
         """Create class variables for widgets"""
         self.labelframe.gain = tk.DoubleVar()
         self.labelframe.level = tk.DoubleVar(value=0)
-        self.labelframe.mute = tk.BooleanVar()
-        self.labelframe.conf = tk.BooleanVar()
         self.labelframe.gainlabel = tk.StringVar()
-
-        """for gainlayers"""
-        self.labelframe.on = tk.BooleanVar()
+        if self.identifier == 'gainlayer':
+            self.labelframe.on = tk.BooleanVar()
+        else:
+            self.labelframe.mute = tk.BooleanVar()
+            self.labelframe.conf = tk.BooleanVar()
 
     def add_progressbar(self):
         """Adds a progress bar widget to a single label frame"""
@@ -297,6 +332,13 @@ class ChannelLabelFrameBuilder(AbstractBuilder):
         self.button_on.grid(column=0, row=2, columnspan=2)
 
     def teardown(self):
+        """Destroys the widgets of a labelframe, releasing their variables"""
+        [child.destroy() for child in self.labelframe.winfo_children()]
+        self.labelframe.gain = self.labelframe.level = self.labelframe.gainlabel = None
+        if self.identifier == 'gainlayer':
+            self.labelframe.on = None
+        else:
+            self.labelframe.mute = self.labelframe.conf = None
         self.labelframe.grid_remove()
 
 
@@ -319,8 +361,7 @@ class ChannelConfigFrameBuilder(AbstractBuilder):
         pass
 
     def teardown(self):
-        """Deregister as observable, then destroy frame"""
-        self.configframe.parent.subject.remove(self.configframe)
+        """Destroy frame, its store subscriptions are dropped with it"""
         self.configframe.destroy()
 
     def grid_configure(self):
@@ -574,12 +615,12 @@ class BusConfigFrameBuilder(ChannelConfigFrameBuilder):
         self.configframe.bus_modes = util.get_busmode_shortnames(self.app.kind)
         self.configframe.int_params = ('mono',)
         self.configframe.int_param_vars = [
-            tk.IntVar(value=getattr(self.configframe.target, param))
+            tk.IntVar(value=self.configframe.getter(param))
             for param in self.configframe.int_params
         ]
         self.configframe.mono_modes = util.get_busmono_modes()
         self.configframe.bus_mono_label_text = tk.StringVar(
-            value=self.configframe.mono_modes[self.configframe.target.mono]
+            value=self.configframe.mono_modes[self.configframe.getter('mono')]
         )
         self.configframe.bool_params = ('eq.on', 'eq.ab')
         self.configframe.bool_param_vars = [
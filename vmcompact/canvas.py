@@ -0,0 +1,618 @@
+import logging
+import tkinter as tk
+from tkinter import ttk
+
+from . import builders, util
+from .data import _base_values, _configuration
+from .levels import peaks, to_display
+
+logger = logging.getLogger(__name__)
+
+# vertical layout of a single channel column
+LABEL_Y = 10
+METER_TOP = 22
+BUTTON_HEIGHT = 20
+BUTTON_GAP = 4
+
+
+class Value:
+    """Python side stand-in for a Tk variable, redraws its channel on set"""
+
+    __slots__ = ('_value', '_callback')
+
+    def __init__(self, value=None, callback=None):
+        self._value = value
+        self._callback = callback
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+        if self._callback:
+            self._callback()
+
+
+class CanvasChannel:
+    """Base class for a single channel drawn on a canvas frame"""
+
+    buttons = ()
+    # store fields synced while the channel is labelled
+    params = ('gain', 'mute')
+    # canvas items are drawn from Values, there are no Tk variables to release
+    built = True
+
+    def __init__(self, parent, index, id):
+        self.parent = parent
+        self.app = parent.parent
+        self.index = index
+        self.id = id
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.styletable = self.app.styletable
+        self.visible = True
+        self.label = ''
+        self.items = {}
+        self._level = 0
+
+        self.gain = Value(0.0, self.draw)
+        self.mute = Value(False, self.draw)
+        self.conf = Value(False, self.draw)
+
+    @property
+    def identifier(self):
+        return self.id
+
+    def getter(self, param):
+        target = self.target
+        if self.app.capabilities.supports(target, param):
+            return getattr(target, param)
+        self.logger.error(f'{type(target).__name__} does not support {param}')
+
+    def setter(self, param, value):
+        target = self.target
+        if self.app.capabilities.supports(target, param):
+            self.app.writer.put(target, param, value)
+            setattr(self.state, param, value)
+
+    def draw(self):
+        """redraws the items of this channel that reflect its state"""
+        if self.items:
+            self.parent.draw_state(self)
+
+    def set_level(self, val):
+        if val != self._level:
+            self._level = val
+            self.parent.draw_level(self)
+
+    def set_gain(self, val):
+        val = round(max(-60, min(12, val)), 1)
+        self.setter('gain', val)
+        self.gain.set(val)
+
+    def reset_gain(self):
+        self.set_gain(0)
+
+    @property
+    def level_gain(self):
+        return self.state.gain or 0
+
+    @property
+    def level_muted(self):
+        return bool(self.state.mute)
+
+    def toggle(self, role):
+        getattr(self, f'toggle_{role}')()
+
+    def toggle_mute(self):
+        self.mute.set(not self.mute.get())
+        self.setter('mute', self.mute.get())
+
+    def reset_conf(self):
+        self.conf.set(False)
+
+    def toggle_conf(self):
+        self.conf.set(not self.conf.get())
+        if self.conf.get():
+            self.parent.configbuilder.create_configframe(
+                self.identifier, self.index, self.id
+            )
+        else:
+            self.parent.parent.config_frame.teardown()
+
+    @property
+    def label_state(self):
+        """the store record holding this channel's label"""
+        return self.state
+
+    def subscribe(self):
+        """syncs the label now and whenever it changes, labelled channels sync params"""
+        self.app.store.subscribe(self.label_state, ('label',), self.on_state)
+
+    def unsubscribe(self):
+        self.app.store.unsubscribe(self.label_state, ('label',), self.on_state)
+        self.app.store.unsubscribe(self.state, self.params, self.on_state)
+
+    def on_state(self, field, value):
+        """called by the store with the new value of a field"""
+        if field == 'label':
+            self.sync_labels(value)
+        else:
+            getattr(self, field).set(value)
+
+    def sync_labels(self, label):
+        """sync label text, the frame is redrawn if the channel changed visibility"""
+        self.label = label
+        visible = bool(label)
+        if visible:
+            self.app.store.subscribe(self.state, self.params, self.on_state)
+        else:
+            self.app.store.unsubscribe(self.state, self.params, self.on_state)
+        if visible != self.visible:
+            self.visible = visible
+            self.parent.schedule_redraw()
+        elif self.items:
+            self.parent.draw_label(self)
+
+
+class CanvasStrip(util.CachedTarget, CanvasChannel):
+    """A single strip drawn on a canvas frame"""
+
+    buttons = ('mute', 'conf')
+
+    def __init__(self, parent, index, id):
+        super().__init__(parent, index, id)
+        self.state = self.app.store.strip[index]
+        if index <= parent.phys_in:
+            self.level_offset = index * 2
+        else:
+            self.level_offset = parent.phys_in * 2 + (index - parent.phys_in) * 8
+
+    def resolve_target(self):
+        """returns the strip class for this channel in the current interface"""
+
+        return getattr(self.parent.target, self.identifier)[self.index]
+
+
+class CanvasBus(util.CachedTarget, CanvasChannel):
+    """A single bus drawn on a canvas frame"""
+
+    buttons = ('mute', 'conf')
+
+    def __init__(self, parent, index, id):
+        super().__init__(parent, index, id)
+        self.state = self.app.store.bus[index]
+        self.level_offset = index * 8
+
+    def resolve_target(self):
+        """returns the bus class for this channel in the current interface"""
+
+        return getattr(self.parent.target, self.identifier)[self.index]
+
+    @property
+    def level_gain(self):
+        """bus levels already include the bus gain"""
+        return 0
+
+
+class CanvasGainLayer(util.CachedTarget, CanvasChannel):
+    """A single gainlayer drawn on a canvas frame"""
+
+    buttons = ('on',)
+    params = ('gain', 'on')
+
+    def __init__(self, parent, index, j):
+        super().__init__(parent, index, 'gainlayer')
+        self.j = j
+        self.state = self.app.store.gainlayer[index][j]
+        self.on = Value(False, self.draw)
+        if index <= parent.phys_in:
+            self.level_offset = index * 2
+        else:
+            self.level_offset = parent.phys_in * 2 + (index - parent.phys_in) * 8
+
+    def resolve_target(self):
+        """returns the strip[i].gainlayer class in the current interface"""
+
+        return self.parent.target.strip[self.index].gainlayer[self.j]
+
+    @property
+    def label_state(self):
+        return self.app.store.strip[self.index]
+
+    @property
+    def level_muted(self):
+        """a gainlayer meter reads 0 if its strip is muted or the layer is off"""
+        return (
+            self.parent.parent.strip_frame is not None and bool(self.label_state.mute)
+        ) or not self.state.on
+
+    def toggle_on(self):
+        self.on.set(not self.on.get())
+        self.app.writer.put(
+            self.parent.target.strip[self.index],
+            self.parent.buses[self.j],
+            self.on.get(),
+        )
+        self.state.on = self.on.get()
+
+
+class CanvasFrame(ttk.Frame):
+    """
+    Base class for a frame that draws all of its channels on a single canvas.
+
+    Meters, faders and buttons are canvas items, updated in place.
+    """
+
+    topics = ('ldirty',)
+    pool_key = None
+    colours = {'mute': 'red', 'conf': 'yellow', 'on': 'green'}
+    texts = {'mute': 'MUTE', 'conf': 'CONFIG', 'on': 'ON'}
+
+    def __init__(self, parent, id):
+        super().__init__(parent)
+        self.parent = parent
+        self.id = id
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.phys_in, self.virt_in = parent.kind.ins
+        self.phys_out, self.virt_out = parent.kind.outs
+        self.configbuilder = builders.MainFrameBuilder(self.parent)
+        self._drag = None
+        self._redraw = None
+
+        self.column_width = _configuration.channel_width + 2 * (
+            _configuration.channel_xpadding
+        )
+        self.meter_height = _configuration.channel_height
+        self.canvas = tk.Canvas(
+            self,
+            height=self.canvas_height,
+            highlightthickness=0,
+            background=self.styletable.lookup('TFrame', 'background') or 'white',
+        )
+        self.canvas.grid(row=0, column=0)
+        self.canvas.bind('<Button-1>', self.on_press)
+        self.canvas.bind('<B1-Motion>', self.on_motion)
+        self.canvas.bind('<ButtonRelease-1>', self.on_release)
+        self.canvas.bind('<Double-Button-1>', self.on_double_click)
+        self.canvas.bind('<MouseWheel>', self.on_mousewheel)
+
+    @property
+    def styletable(self):
+        return self.parent.styletable
+
+    @property
+    def foreground(self):
+        return self.styletable.lookup('TLabel', 'foreground') or 'black'
+
+    @property
+    def canvas_height(self):
+        return (
+            METER_TOP
+            + self.meter_height
+            + BUTTON_HEIGHT
+            + len(self.channel_cls.buttons) * (BUTTON_HEIGHT + BUTTON_GAP)
+        )
+
+    @property
+    def target(self):
+        """returns the current interface"""
+
+        return self.parent.target
+
+    @property
+    def identifier(self):
+        return self.id
+
+    @property
+    def labelframes(self):
+        """returns the channels drawn on this frame"""
+
+        return self.channels
+
+    def setup(self):
+        """subscribes every channel to the store, then draws the visible ones"""
+        [channel.subscribe() for channel in self.channels]
+        self.redraw()
+        self.parent.subject.add(self)
+
+    def schedule_redraw(self):
+        """redraws once the current update is done, however many channels changed"""
+        if self._redraw is None:
+            self._redraw = self.after_idle(self.redraw)
+
+    def cancel_redraw(self):
+        if self._redraw is not None:
+            self.after_cancel(self._redraw)
+            self._redraw = None
+
+    def redraw(self):
+        """clears the canvas, draws every visible channel in its own column"""
+        self.cancel_redraw()
+        self.canvas.delete('all')
+        visible = [channel for channel in self.channels if channel.visible]
+        for column, channel in enumerate(visible):
+            self.draw_channel(channel, column)
+        for channel in self.channels:
+            if not channel.visible:
+                channel.items = {}
+        self.canvas.configure(width=max(1, len(visible)) * self.column_width)
+
+    def draw_channel(self, channel, column):
+        x0 = column * self.column_width
+        centre = x0 + self.column_width // 2
+        bottom = METER_TOP + self.meter_height
+        tag = f'ch{channel.index}'
+        items = channel.items = {}
+        items['label'] = self.canvas.create_text(
+            centre, LABEL_Y, text=self.truncate(channel.label), fill=self.foreground
+        )
+        self.canvas.create_rectangle(
+            centre - 16, METER_TOP, centre - 4, bottom, outline=self.foreground
+        )
+        items['level'] = self.canvas.create_rectangle(
+            centre - 15, bottom, centre - 5, bottom, fill='green', width=0
+        )
+        self.canvas.create_line(
+            centre + 10,
+            METER_TOP,
+            centre + 10,
+            bottom,
+            width=2,
+            fill=self.foreground,
+            tags=(tag, 'fader'),
+        )
+        items['thumb'] = self.canvas.create_rectangle(
+            centre + 2, 0, centre + 18, 0, fill='grey', tags=(tag, 'fader')
+        )
+        items['gainlabel'] = self.canvas.create_text(
+            centre, bottom + BUTTON_HEIGHT // 2, fill=self.foreground
+        )
+        for i, role in enumerate(channel.buttons):
+            y0 = bottom + BUTTON_HEIGHT + i * (BUTTON_HEIGHT + BUTTON_GAP)
+            items[role] = self.canvas.create_rectangle(
+                x0 + 4,
+                y0,
+                x0 + self.column_width - 4,
+                y0 + BUTTON_HEIGHT,
+                outline=self.foreground,
+                tags=(tag, role),
+            )
+            self.canvas.create_text(
+                centre,
+                y0 + BUTTON_HEIGHT // 2,
+                text=self.texts[role],
+                fill=self.foreground,
+                tags=(tag, role),
+            )
+        self.draw_state(channel)
+        self.draw_level(channel)
+
+    def draw_state(self, channel):
+        items = channel.items
+        gain = channel.gain.get() or 0
+        y = METER_TOP + (12 - gain) / 72 * self.meter_height
+        x0, _, x1, _ = self.canvas.coords(items['thumb'])
+        self.canvas.coords(items['thumb'], x0, y - 4, x1, y + 4)
+        self.canvas.itemconfigure(items['gainlabel'], text=round(gain, 1))
+        for role in channel.buttons:
+            self.canvas.itemconfigure(
+                items[role],
+                fill=self.colours[role] if getattr(channel, role).get() else '',
+            )
+
+    def draw_level(self, channel):
+        if level := channel.items.get('level'):
+            bottom = METER_TOP + self.meter_height
+            x0, _, x1, _ = self.canvas.coords(level)
+            self.canvas.coords(
+                level, x0, bottom - channel._level / 72 * self.meter_height, x1, bottom
+            )
+
+    def draw_label(self, channel):
+        if label := channel.items.get('label'):
+            self.canvas.itemconfigure(label, text=self.truncate(channel.label))
+
+    def truncate(self, label):
+        return f'{label[:8]}..' if len(label) > 10 else label
+
+    def hit(self):
+        """returns the channel and role of the item under the pointer"""
+        for tag in self.canvas.gettags('current'):
+            if tag.startswith('ch'):
+                channel = self.channels[int(tag[2:])]
+                role = next(
+                    t
+                    for t in self.canvas.gettags('current')
+                    if t != tag and t != 'current'
+                )
+                return channel, role
+        return None, None
+
+    def gain_at(self, y):
+        return 12 - (y - METER_TOP) / self.meter_height * 72
+
+    def on_press(self, event):
+        channel, role = self.hit()
+        if channel is None:
+            return
+        if role == 'fader':
+            self._drag = channel
+            self.after(1, self.remove_events)
+        else:
+            self.pause_updates(channel.toggle, role)
+
+    def on_motion(self, event):
+        if self._drag:
+            self._drag.set_gain(self.gain_at(event.y))
+
+    def on_release(self, event):
+        if self._drag:
+            self._drag = None
+            _base_values.run_update = False
+            self.after(1, self.add_events)
+
+    def on_double_click(self, event):
+        channel, role = self.hit()
+        if role == 'fader':
+            channel.reset_gain()
+
+    def on_mousewheel(self, event):
+        visible = [channel for channel in self.channels if channel.visible]
+        column = int(self.canvas.canvasx(event.x) // self.column_width)
+        if 0 <= column < len(visible):
+            channel = visible[column]
+            self.pause_updates(
+                channel.set_gain,
+                channel.gain.get()
+                + (
+                    _configuration.mwscroll_step
+                    if event.delta > 0
+                    else -_configuration.mwscroll_step
+                ),
+            )
+
+    def remove_events(self):
+        self.target.event.remove('pdirty')
+        self.target.event.remove('ldirty')
+
+    def add_events(self):
+        self.target.event.add('pdirty')
+        self.target.event.add('ldirty')
+        self.after(500, self.resume_updates)
+
+    def pause_updates(self, func, *args):
+        """function wrapper, adds a 50ms delay on updates"""
+        _base_values.run_update = False
+
+        func(*args)
+
+        self.after(50, self.resume_updates)
+
+    def resume_updates(self):
+        _base_values.run_update = True
+
+    def on_update(self, subject):
+        if subject == 'ldirty':
+            self.upd_levels()
+
+    def upd_levels(self):
+        """
+        Updates the level meters of every visible channel in a single pass.
+        """
+        if not (levels := self.levels):
+            return
+        display = to_display(
+            peaks(levels, self.level_offsets),
+            [channel.level_gain for channel in self.channels],
+            [channel.level_muted for channel in self.channels],
+        )
+        for channel, val in zip(self.channels, display):
+            if channel.visible:
+                channel.set_level(val)
+
+    def hide(self):
+        """deregisters the frame, then hides it"""
+        self.parent.subject.remove(self)
+        [channel.unsubscribe() for channel in self.channels]
+        self.cancel_redraw()
+        [channel.reset_conf() for channel in self.channels if channel.conf.get()]
+        self.grid_remove()
+
+    def show(self):
+        """re-grids a pooled frame, re-registers it and resubscribes its channels"""
+        self.place()
+        self.parent.subject.add(self)
+        [channel.subscribe() for channel in self.channels]
+
+    def teardown(self):
+        """hides the frame, pooling it for reuse if the pool accepts it"""
+        self.hide()
+        if not self.parent.pool.release(self.pool_key, self):
+            self.destroy()
+
+    def destroy(self):
+        self.cancel_redraw()
+        super().destroy()
+
+
+class CanvasChannelFrame(CanvasFrame):
+    """Draws every strip or bus of a kind on a single canvas"""
+
+    def __init__(self, parent, id):
+        self.channel_cls = CanvasStrip if id == 'strip' else CanvasBus
+        super().__init__(parent, id)
+        if id == 'strip':
+            self.strips = tuple(
+                CanvasStrip(self, i, id) for i in range(self.phys_in + self.virt_in)
+            )
+            self.channels = self.strips
+        else:
+            self.buses = tuple(
+                CanvasBus(self, i, id) for i in range(self.phys_out + self.virt_out)
+            )
+            self.channels = self.buses
+        self.level_offsets = [channel.level_offset for channel in self.channels]
+        self.place()
+        self.setup()
+
+    @property
+    def levels(self):
+        return getattr(self.parent.levels, self.identifier)
+
+    def place(self):
+        if self.identifier == 'strip':
+            self.grid(row=0, column=0, sticky=(tk.W))
+        elif _configuration.extended:
+            if _configuration.extends_horizontal:
+                self.grid(row=0, column=2, sticky=(tk.W))
+            else:
+                self.grid(row=2, column=0, sticky=(tk.W))
+        else:
+            self.grid(row=0, column=0)
+
+    def teardown(self):
+        super().teardown()
+        setattr(self.parent, f'{self.identifier}_frame', None)
+
+
+class CanvasSubMixFrame(CanvasFrame):
+    """Draws the gainlayers of the current submix on a single canvas"""
+
+    def __init__(self, parent):
+        self.channel_cls = CanvasGainLayer
+        super().__init__(parent, 'gainlayer')
+        self.buses = tuple(f'A{i + 1}' for i in range(self.phys_out)) + tuple(
+            f'B{i + 1}' for i in range(self.virt_out)
+        )
+        self.gainlayers = tuple(
+            CanvasGainLayer(self, index, _configuration.submixes)
+            for index in range(self.phys_in + self.virt_in)
+        )
+        self.channels = self.gainlayers
+        self.level_offsets = [channel.level_offset for channel in self.channels]
+        self.place()
+        self.setup()
+
+    @property
+    def levels(self):
+        return self.parent.levels.strip
+
+    def place(self):
+        """grids the submix frame in place of the bus frame"""
+        parent = self.parent
+        if _configuration.extends_horizontal:
+            self.grid(row=0, column=2)
+            if parent.bus_frame:
+                parent.bus_frame.grid_remove()
+        else:
+            if parent.bus_frame and parent.bus_frame.grid_info():
+                self.grid(
+                    row=parent.bus_frame.grid_info()['row'], column=0, sticky=(tk.W)
+                )
+                parent.bus_frame.grid_remove()
+            else:
+                self.grid(row=2, column=0, sticky=(tk.W))
+
+    def teardown(self):
+        super().teardown()
+        self.parent.submix_frame = None
@@ -0,0 +1,44 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Capabilities:
+    """
+    Index of the parameters supported by each interface class.
+
+    Strip, bus and gainlayer classes are created per kind (and per interface),
+    so indexing them by class answers supports() in O(1) without calling dir().
+    """
+
+    def __init__(self):
+        self.logger = logger.getChild(self.__class__.__name__)
+        self._index = {}
+
+    def build(self, target):
+        """indexes the channel classes of an interface"""
+        self._index.clear()
+        for strip in target.strip:
+            self.params(strip)
+            for gainlayer in getattr(strip, 'gainlayer', ()):
+                self.params(gainlayer)
+        for bus in target.bus:
+            self.params(bus)
+        self.logger.debug(f'indexed {len(self._index)} classes for {target}')
+
+    def params(self, obj) -> frozenset:
+        """returns the attributes of an object's class, indexing it on first use"""
+        try:
+            return self._index[type(obj)]
+        except KeyError:
+            params = self._index[type(obj)] = frozenset(dir(obj))
+            return params
+
+    def supports(self, obj, param) -> bool:
+        """does obj support param? dotted params such as comp.knob are resolved"""
+        *path, param = param.split('.')
+        for attr in path:
+            if attr not in self.params(obj):
+                return False
+            obj = getattr(obj, attr)
+        return param in self.params(obj)
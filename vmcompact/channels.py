@@ -2,8 +2,9 @@ import logging
 import tkinter as tk
 from tkinter import ttk
 
-from . import builders
+from . import builders, util
 from .data import _base_values, _configuration
+from .levels import peaks, to_display
 
 logger = logging.getLogger(__name__)
 
@@ -11,24 +12,24 @@ logger = logging.getLogger(__name__)
 class ChannelLabelFrame(ttk.LabelFrame):
     """Base class for a single channel"""
 
+    # store fields synced while the channel is labelled
+    params = ('gain', 'mute')
+
     def __init__(self, parent, index, id):
         super().__init__(parent)
         self.parent = parent
+        self.app = parent.parent
         self.index = index
         self.id = id
+        self.state = getattr(self.app.store, id)[index]
+        self.visible = True
+        self.built = False
+        self._level = 0
         self.logger = logger.getChild(self.__class__.__name__)
         self.styletable = self.parent.parent.styletable
 
         self.builder = builders.ChannelLabelFrameBuilder(self, index, id)
-        self.builder.setup()
-        self.builder.add_progressbar()
-        self.builder.add_scale()
-        self.builder.add_mute_button()
-        self.builder.add_conf_button()
-        self.builder.add_gain_label()
-        self.sync_params()
-        self.sync_labels()
-        self.grid_configure()
+        self.subscribe()
 
         self.configbuilder = builders.MainFrameBuilder(self.parent.parent)
 
@@ -42,15 +43,36 @@ class ChannelLabelFrame(ttk.LabelFrame):
 
         return self.parent.target
 
+    def build(self):
+        """builds the widgets and their variables, once the channel is labelled"""
+        if self.built:
+            return
+        self.builder.setup()
+        self.builder.add_progressbar()
+        self.builder.add_scale()
+        self.builder.add_mute_button()
+        self.builder.add_conf_button()
+        self.builder.add_gain_label()
+        self.grid_configure()
+        self.built = True
+
+    def release(self):
+        """destroys the widgets and their variables of an unlabelled channel, hides it"""
+        self.builder.teardown()
+        self._level = 0
+        self.built = False
+
     def getter(self, param):
-        try:
-            return getattr(self.target, param)
-        except AttributeError as e:
-            self.logger(f'{type(e).__name__}: {e}')
+        target = self.target
+        if self.app.capabilities.supports(target, param):
+            return getattr(target, param)
+        self.logger.error(f'{type(target).__name__} does not support {param}')
 
     def setter(self, param, value):
-        if param in dir(self.target):  # avoid calling getattr (with hasattr)
-            setattr(self.target, param, value)
+        target = self.target
+        if self.app.capabilities.supports(target, param):
+            self.app.writer.put(target, param, value)
+            setattr(self.state, param, value)
 
     def scale_callback(self, *args):
         """callback function for scale widget"""
@@ -60,7 +82,7 @@ class ChannelLabelFrame(ttk.LabelFrame):
         self.gainlabel.set(val)
 
     def toggle_mute(self, *args):
-        self.target.mute = self.mute.get()
+        self.setter('mute', self.mute.get())
         if not _configuration.themes_enabled:
             self.styletable.configure(
                 f'{self.identifier}Mute{self.index}.TButton',
@@ -70,7 +92,7 @@ class ChannelLabelFrame(ttk.LabelFrame):
     def reset_gain(self, *args):
         self.setter('gain', 0)
         self.gain.set(0)
-        self.gainlabel.set(self.gain.get())
+        self.gainlabel.set(0)
 
     def scale_press(self, *args):
         self.after(1, self.remove_events)
@@ -100,23 +122,26 @@ class ChannelLabelFrame(ttk.LabelFrame):
         _base_values.run_update = True
 
     def _on_mousewheel(self, event):
-        self.gain.set(
-            round(
-                self.gain.get()
-                + (
-                    _configuration.mwscroll_step
-                    if event.delta > 0
-                    else -_configuration.mwscroll_step
-                ),
-                1,
-            )
+        val = round(
+            (self.state.gain or 0)
+            + (
+                _configuration.mwscroll_step
+                if event.delta > 0
+                else -_configuration.mwscroll_step
+            ),
+            1,
         )
-        if self.gain.get() > 12:
-            self.gain.set(12)
-        elif self.gain.get() < -60:
-            self.gain.set(-60)
-        self.setter('gain', self.gain.get())
-        self.gainlabel.set(round(self.gain.get(), 1))
+        val = max(-60, min(12, val))
+        self.gain.set(val)
+        self.setter('gain', val)
+        self.gainlabel.set(val)
+
+    def reset_conf(self):
+        self.conf.set(False)
+        if not _configuration.themes_enabled:
+            self.styletable.configure(
+                f'{self.identifier}Conf{self.index}.TButton', background='white'
+            )
 
     def open_config(self):
         if self.conf.get():
@@ -129,40 +154,52 @@ class ChannelLabelFrame(ttk.LabelFrame):
                 background=f'{"yellow" if self.conf.get() else "white"}',
             )
 
-    def on_update(self, subject):
-        if subject == 'ldirty':
-            self.upd_levels()
-        elif subject == 'pdirty':
-            self.sync_params()
-        elif subject == 'labelframe':
-            self.after(5, self.sync_labels)
-
-    def sync_params(self):
-        """sync parameter states, update button colours"""
-        self.gain.set(self.getter('gain'))
-        self.gainlabel.set(round(self.gain.get(), 1))
-        self.mute.set(self.getter('mute'))
-        if not _configuration.themes_enabled:
-            self.styletable.configure(
-                f'{self.identifier}Mute{self.index}.TButton',
-                background=f'{"red" if self.mute.get() else "white"}',
-            )
+    def subscribe(self):
+        """syncs the label now and whenever it changes, labelled channels sync params"""
+        self.app.store.subscribe(self.state, ('label',), self.on_state)
+
+    def unsubscribe(self):
+        self.app.store.unsubscribe(self.state, ('label', *self.params), self.on_state)
+
+    def on_state(self, field, value):
+        """called by the store with the new value of a field"""
+        if field == 'label':
+            self.sync_labels(value)
+        elif field == 'gain':
+            self.gain.set(value)
+            self.gainlabel.set(round(value, 1))
+        elif field == 'mute':
+            self.mute.set(value)
+            if not _configuration.themes_enabled:
+                self.styletable.configure(
+                    f'{self.identifier}Mute{self.index}.TButton',
+                    background=f'{"red" if value else "white"}',
+                )
 
-    def sync_labels(self):
+    @property
+    def level_muted(self):
+        return bool(self.state.mute)
+
+    def set_level(self, val):
+        """sets the progressbar, skipping the Tcl call if the value is unchanged"""
+        if val != self._level:
+            self._level = val
+            self.level.set(val)
+
+    def sync_labels(self, label):
         """sync labelframes according to label text"""
-        retval = self.getter('label')
-        if self.parent.label_cache[self.id][self.index] != retval:
-            self.parent.label_cache[self.id][self.index] = retval
-            if len(retval) > 10:
-                retval = f'{retval[:8]}..'
-            if not retval:
-                self.parent.columnconfigure(self.index, minsize=0)
-                self.parent.parent.subject.remove(self)
-                self.grid_remove()
-            else:
-                self.parent.parent.subject.add(self)
-                self.grid()
-            self.configure(text=retval)
+        if len(label) > 10:
+            label = f'{label[:8]}..'
+        self.visible = bool(label)
+        if not label:
+            self.parent.columnconfigure(self.index, minsize=0)
+            self.app.store.unsubscribe(self.state, self.params, self.on_state)
+            self.release()
+        else:
+            self.build()
+            self.app.store.subscribe(self.state, self.params, self.on_state)
+            self.grid()
+        self.configure(text=label)
 
     def grid_configure(self):
         self.grid(padx=_configuration.channel_xpadding, sticky=(tk.N, tk.S))
@@ -178,7 +215,7 @@ class ChannelLabelFrame(ttk.LabelFrame):
         ]
 
 
-class Strip(ChannelLabelFrame):
+class Strip(util.CachedTarget, ChannelLabelFrame):
     """Concrete class representing a single strip"""
 
     def __init__(self, parent, index, id):
@@ -188,76 +225,46 @@ class Strip(ChannelLabelFrame):
         else:
             self.level_offset = parent.phys_in * 2 + (index - parent.phys_in) * 8
 
-    @property
-    def target(self):
+    def resolve_target(self):
         """returns the strip class for this labelframe in the current interface"""
 
-        _target = super(Strip, self).target
-        return getattr(_target, self.identifier)[self.index]
+        return getattr(self.parent.target, self.identifier)[self.index]
 
-    def upd_levels(self):
-        """
-        Updates level values using direct dB values.
-        """
-        if self.index < self.parent.parent.kind.num_strip:
-            if self.target.levels.is_updated:
-                val = max(self.target.levels.prefader)
-                if val < -72:
-                    if self.level.get() != 0:
-                        self.level.set(0)
-                    return
-                # Convert dB to progressbar: -60dB=0, 0dB=60, +12dB=72
-                if self.mute.get():
-                    level_display = 0
-                else:
-                    level_db = val + self.gain.get()
-                    level_display = max(0, min(72, level_db + 60))
-                self.level.set(level_display)
-
-
-class Bus(ChannelLabelFrame):
+    @property
+    def level_gain(self):
+        """strip meters are post gain"""
+        return self.state.gain or 0
+
+
+class Bus(util.CachedTarget, ChannelLabelFrame):
     """Concrete bus class representing a single bus"""
 
     def __init__(self, parent, index, id):
         super().__init__(parent, index, id)
         self.level_offset = index * 8
 
-    @property
-    def target(self):
+    def resolve_target(self):
         """returns the bus class for this labelframe in the current interface"""
 
-        _target = super(Bus, self).target
-        return getattr(_target, self.identifier)[self.index]
+        return getattr(self.parent.target, self.identifier)[self.index]
 
-    def upd_levels(self):
-        if self.index < self.parent.parent.kind.num_bus:
-            if self.target.levels.is_updated:
-                val = max(self.target.levels.all)
-                if val < -72:
-                    if self.level.get() != 0:
-                        self.level.set(0)
-                    return
-                # Convert dB to progressbar: -60dB=0, 0dB=60, +12dB=72
-                if self.mute.get():
-                    level_display = 0
-                else:
-                    level_display = max(0, min(72, val + 60))
-                self.level.set(level_display)
+    @property
+    def level_gain(self):
+        """bus levels already include the bus gain"""
+        return 0
 
 
 class ChannelFrame(ttk.Frame):
+    topics = ('ldirty',)
+    pool_key = None
+
     def init(self, parent, id):
         super().__init__(parent)
         self.parent = parent
         self.id = id
         self.phys_in, self.virt_in = parent.kind.ins
         self.phys_out, self.virt_out = parent.kind.outs
-        self.label_cache = {
-            'strip': [''] * (self.phys_in + self.virt_in),
-            'bus': [''] * (self.phys_out + self.virt_out),
-        }
         self.parent.subject.add(self)
-        self.update_labels()
 
     @property
     def target(self):
@@ -279,13 +286,24 @@ class ChannelFrame(ttk.Frame):
             if isinstance(frame, ttk.LabelFrame)
         )
 
-    def update_labels(self):
-        for labelframe in self.labelframes:
-            labelframe.on_update('labelframe')
-
     def on_update(self, subject):
-        if subject == 'pdirty':
-            self.update_labels()
+        if subject == 'ldirty':
+            self.upd_levels()
+
+    def upd_levels(self):
+        """
+        Updates the level meters of every visible channel in a single pass.
+        """
+        if not (levels := getattr(self.parent.levels, self.identifier)):
+            return
+        display = to_display(
+            peaks(levels, self.level_offsets),
+            [channel.level_gain for channel in self.channels],
+            [channel.level_muted for channel in self.channels],
+        )
+        for channel, val in zip(self.channels, display):
+            if channel.visible:
+                channel.set_level(val)
 
     def grid_configure(self):
         [
@@ -294,10 +312,28 @@ class ChannelFrame(ttk.Frame):
         ]
         [self.rowconfigure(0, minsize=100) for i, _ in enumerate(self.labelframes)]
 
-    def teardown(self):
-        [self.parent.subject.remove(frame) for frame in self.labelframes]
+    def hide(self):
+        """deregisters the frame and its labelframes, then hides it"""
+        [labelframe.unsubscribe() for labelframe in self.channels]
         self.parent.subject.remove(self)
-        self.destroy()
+        [
+            labelframe.reset_conf()
+            for labelframe in self.channels
+            if labelframe.built and labelframe.conf.get()
+        ]
+        self.grid_remove()
+
+    def show(self):
+        """re-grids a pooled frame, re-registers it and syncs its labelframes"""
+        self.place()
+        self.parent.subject.add(self)
+        [labelframe.subscribe() for labelframe in self.channels]
+
+    def teardown(self):
+        """hides the frame, pooling it for reuse if the pool accepts it"""
+        self.hide()
+        if not self.parent.pool.release(self.pool_key, self):
+            self.destroy()
         setattr(self.parent, f'{self.identifier}_frame', None)
 
 
@@ -318,24 +354,34 @@ def _make_channelframe(parent, identifier):
             getattr(self, 'strips' if identifier == 'strip' else 'buses')
         ):
             labelframe.grid(row=0, column=i)
-            label = labelframe.target.label
-            if not label:
+            if not labelframe.visible:
                 self.columnconfigure(i, minsize=0)
                 labelframe.grid_remove()
-            self.label_cache[identifier][i] = label
 
     def init_strip(self, *args, **kwargs):
         self.init(parent, identifier)
         self.strips = tuple(
             Strip(self, i, identifier) for i in range(phys_in + virt_in)
         )
-        self.grid(row=0, column=0, sticky=(tk.W))
+        self.channels = self.strips
+        self.level_offsets = [strip.level_offset for strip in self.strips]
+        self.place()
         self.grid_configure()
         init_labels(self)
 
+    def place_strip(self):
+        self.grid(row=0, column=0, sticky=(tk.W))
+
     def init_bus(self, *args, **kwargs):
         self.init(parent, identifier)
         self.buses = tuple(Bus(self, i, identifier) for i in range(phys_out + virt_out))
+        self.channels = self.buses
+        self.level_offsets = [bus.level_offset for bus in self.buses]
+        self.place()
+        self.grid_configure()
+        init_labels(self)
+
+    def place_bus(self):
         if _configuration.extended:
             if _configuration.extends_horizontal:
                 self.grid(row=0, column=2, sticky=(tk.W))
@@ -343,8 +389,6 @@ def _make_channelframe(parent, identifier):
                 self.grid(row=2, column=0, sticky=(tk.W))
         else:
             self.grid(row=0, column=0)
-        self.grid_configure()
-        init_labels(self)
 
     if identifier == 'strip':
         CHANNELFRAME_cls = type(
@@ -352,6 +396,7 @@ def _make_channelframe(parent, identifier):
             (ChannelFrame,),
             {
                 '__init__': init_strip,
+                'place': place_strip,
             },
         )
     else:
@@ -360,6 +405,7 @@ def _make_channelframe(parent, identifier):
             (ChannelFrame,),
             {
                 '__init__': init_bus,
+                'place': place_bus,
             },
         )
     return CHANNELFRAME_cls(parent)
@@ -1,7 +1,8 @@
 import logging
+from functools import partial
 from tkinter import ttk
 
-from . import builders
+from . import builders, util
 from .data import _base_values, _configuration
 
 logger = logging.getLogger(__name__)
@@ -11,14 +12,15 @@ class Config(ttk.Frame):
     def __init__(self, parent, index, _id):
         super().__init__(parent)
         self.parent = parent
+        self.app = parent
         self.index = index
         self.id = _id
         self.logger = logger.getChild(self.__class__.__name__)
         self.styletable = parent.styletable
         self.phys_in, self.virt_in = parent.kind.ins
         self.phys_out, self.virt_out = parent.kind.outs
-
-        self.parent.subject.add(self)
+        # (record, callback) pairs subscribed to the store
+        self._subscriptions = []
 
     @property
     def identifier(self):
@@ -30,27 +32,51 @@ class Config(ttk.Frame):
 
         return self.parent.target
 
+    def resolve(self, param):
+        """
+        returns the object owning param and the attribute name
+
+        dotted params such as comp.knob are resolved, None if not supported
+        """
+        target = self.target
+        if not self.app.capabilities.supports(target, param):
+            self.logger.error(f'{type(target).__name__} does not support {param}')
+            return None, None
+        *path, attr = param.split('.')
+        for p in path:
+            target = getattr(target, p)
+        return target, attr
+
     def getter(self, param):
-        param = param.split('.')
-        try:
-            if len(param) == 2:
-                target = getattr(self.target, param[0])
-                return getattr(target, param[1])
-            else:
-                return getattr(self.target, param[0])
-        except AttributeError as e:
-            self.logger.error(f'{type(e).__name__}: {e}')
+        target, attr = self.resolve(param)
+        if target is not None:
+            return getattr(target, attr)
 
     def setter(self, param, value):
-        param = param.split('.')
-        try:
-            if len(param) == 2:
-                target = getattr(self.target, param[0])
-                setattr(target, param[1], value)
-            else:
-                setattr(self.target, param[0], value)
-        except AttributeError as e:
-            self.logger(f'{type(e).__name__}: {e}')
+        target, attr = self.resolve(param)
+        if target is not None:
+            self.app.writer.put(target, attr, value)
+            self.app.store.param(self.identifier, self.index, param).value = value
+
+    def subscribe(self, record, callback):
+        """calls callback(field, value) with the value of record now and whenever it changes"""
+        self._subscriptions.append((record, callback))
+        self.app.store.subscribe(record, ('value',), callback)
+
+    def subscribe_param(self, param, callback):
+        if not self.app.capabilities.supports(self.target, param):
+            self.logger.error(f'{type(self.target).__name__} does not support {param}')
+            return
+        self.subscribe(
+            self.app.store.param(self.identifier, self.index, param), callback
+        )
+
+    def unsubscribe(self):
+        [
+            self.app.store.unsubscribe(record, ('value',), callback)
+            for record, callback in self._subscriptions
+        ]
+        self._subscriptions.clear()
 
     def scale_press(self, *args):
         self.after(1, self.remove_events)
@@ -81,17 +107,17 @@ class Config(ttk.Frame):
 
     def scale_enter(self, param, *args):
         val = self.slider_vars[self.slider_params.index(param)].get()
-        self.parent.nav_frame.info_text.set(round(val, 1))
+        self.parent.nav_frame.show_value(round(val, 1))
 
     def scale_leave(self, *args):
-        self.parent.nav_frame.info_text.set('')
+        self.parent.nav_frame.clear_value()
 
     def scale_callback(self, param, *args):
         """callback function for scale widget"""
 
         val = self.slider_vars[self.slider_params.index(param)].get()
         self.setter(param, round(val, 1))
-        self.parent.nav_frame.info_text.set(round(val, 1))
+        self.parent.nav_frame.show_value(round(val, 1))
 
     def reset_scale(self, param, val, *args):
         self.setter(param, val)
@@ -105,13 +131,29 @@ class Config(ttk.Frame):
                 f'{param}.TButton', background=f'{"green" if val else "white"}'
             )
 
-    def on_update(self, subject):
-        """update parameters"""
-        if subject == 'pdirty':
-            self.sync()
+    def subscribe_toggles(self, params, param_vars):
+        """syncs toggle buttons with the store, updating their colours"""
+        [
+            self.subscribe_param(param, partial(self.on_toggle, param, var))
+            for param, var in zip(params, param_vars)
+        ]
+
+    def on_toggle(self, param, var, field, value):
+        var.set(value)
+        if not _configuration.themes_enabled:
+            self.styletable.configure(
+                f'{param}.TButton', background=f'{"green" if value else "white"}'
+            )
+
+    def on_slider(self, var, field, value):
+        var.set(value)
 
+    def destroy(self):
+        self.unsubscribe()
+        super().destroy()
 
-class StripConfig(Config):
+
+class StripConfig(util.CachedTarget, Config):
     def __init__(self, parent, index, _id):
         super().__init__(parent, index, _id)
         self.grid(column=0, row=1, columnspan=4, padx=(2,))
@@ -123,14 +165,12 @@ class StripConfig(Config):
         self.builder.grid_configure()
 
         self.parent.target.clear_dirty()
-        self.sync()
+        self.subscribe_params()
 
-    @property
-    def target(self):
+    def resolve_target(self):
         """returns the strip class for this configframe in the current interface"""
 
-        _target = super(StripConfig, self).target
-        return getattr(_target, self.identifier)[self.index]
+        return getattr(self.parent.target, self.identifier)[self.index]
 
     def make_row_0(self):
         if self.index < self.phys_in:
@@ -167,50 +207,18 @@ class StripConfig(Config):
     def teardown(self):
         self.builder.teardown()
 
-    def sync(self):
-        [
-            self.phys_out_params_vars[i].set(self.getter(param))
-            for i, param in enumerate(self.phys_out_params)
-        ]
-        [
-            self.virt_out_params_vars[i].set(self.getter(param))
-            for i, param in enumerate(self.virt_out_params)
-        ]
-        [
-            self.bool_param_vars[i].set(self.getter(param))
-            for i, param in enumerate(self.bool_params)
-        ]
-        [
-            self.slider_vars[i].set(self.getter(param))
-            for i, param in enumerate(self.slider_params)
-            if self.index < self.phys_in
-        ]
-
-        if not _configuration.themes_enabled:
-            [
-                self.styletable.configure(
-                    f'{param}.TButton',
-                    background=f'{"green" if self.phys_out_params_vars[i].get() else "white"}',
-                )
-                for i, param in enumerate(self.phys_out_params)
-            ]
-            [
-                self.styletable.configure(
-                    f'{param}.TButton',
-                    background=f'{"green" if self.virt_out_params_vars[i].get() else "white"}',
-                )
-                for i, param in enumerate(self.virt_out_params)
-            ]
+    def subscribe_params(self):
+        self.subscribe_toggles(self.phys_out_params, self.phys_out_params_vars)
+        self.subscribe_toggles(self.virt_out_params, self.virt_out_params_vars)
+        self.subscribe_toggles(self.bool_params, self.bool_param_vars)
+        if self.index < self.phys_in:
             [
-                self.styletable.configure(
-                    f'{param}.TButton',
-                    background=f'{"green" if self.param_vars[i].get() else "white"}',
-                )
-                for i, param in enumerate(self.bool_params)
+                self.subscribe_param(param, partial(self.on_slider, var))
+                for param, var in zip(self.slider_params, self.slider_vars)
             ]
 
 
-class BusConfig(Config):
+class BusConfig(util.CachedTarget, Config):
     def __init__(self, parent, index, _id):
         super().__init__(parent, index, _id)
         if _configuration.extends_horizontal:
@@ -224,14 +232,12 @@ class BusConfig(Config):
         self.builder.grid_configure()
 
         self.parent.target.clear_dirty()
-        self.sync()
+        self.subscribe_params()
 
-    @property
-    def target(self):
+    def resolve_target(self):
         """returns the bus class for this configframe in the current interface"""
 
-        _target = super(BusConfig, self).target
-        return getattr(_target, self.identifier)[self.index]
+        return getattr(self.parent.target, self.identifier)[self.index]
 
     def make_row_0(self):
         self.builder.create_bus_mode_button()
@@ -249,7 +255,8 @@ class BusConfig(Config):
         next_index = (current_index + 1) % len(self.bus_modes)
         next_mode = self.bus_modes[next_index]
 
-        setattr(self.target.mode, next_mode, True)
+        self.app.writer.put(self.target.mode, next_mode, True)
+        self.app.store.bus_mode[self.index].value = next_mode
         self.bus_mode_label_text.set(self.bus_mode_map[next_mode])
 
     def rotate_bus_modes_left(self, *args):
@@ -258,7 +265,8 @@ class BusConfig(Config):
         prev_index = (current_index - 1) % len(self.bus_modes)
         prev_mode = self.bus_modes[prev_index]
 
-        setattr(self.target.mode, prev_mode, True)
+        self.app.writer.put(self.target.mode, prev_mode, True)
+        self.app.store.bus_mode[self.index].value = prev_mode
         self.bus_mode_label_text.set(self.bus_mode_map[prev_mode])
 
     def rotate_mono_right(self, *args):
@@ -276,17 +284,9 @@ class BusConfig(Config):
     def teardown(self):
         self.builder.teardown()
 
-    def sync(self):
-        [
-            self.bool_param_vars[i].set(self.getter(param))
-            for i, param in enumerate(self.bool_params)
-        ]
-        self.bus_mode_label_text.set(self.bus_mode_map[self.current_bus_mode()])
-        if not _configuration.themes_enabled:
-            [
-                self.styletable.configure(
-                    f'{param}.TButton',
-                    background=f'{"green" if self.bool_param_vars[i].get() else "white"}',
-                )
-                for i, param in enumerate(self.bool_params)
-            ]
+    def subscribe_params(self):
+        self.subscribe_toggles(self.bool_params, self.bool_param_vars)
+        self.subscribe(self.app.store.bus_mode[self.index], self.on_bus_mode)
+
+    def on_bus_mode(self, field, value):
+        self.bus_mode_label_text.set(self.bus_mode_map[value])
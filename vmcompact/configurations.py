@@ -1,4 +1,7 @@
+import bisect
 import logging
+import os
+from collections.abc import Mapping
 from pathlib import Path
 
 try:
@@ -10,6 +13,9 @@ logger = logging.getLogger(__name__)
 
 configuration = {}
 
+# parsed documents keyed by path, reused while (mtime, size) is unchanged
+_parsed = {}
+
 
 def get_configpath():
     for pn in (
@@ -22,24 +28,50 @@ def get_configpath():
             return pn
 
 
+def parse(filepath):
+    """parses a TOML file, unless it is unchanged since it was last parsed"""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        _parsed.pop(filepath, None)
+        return
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if (cached := _parsed.get(filepath)) and cached[0] == stamp:
+        return cached[1]
+    try:
+        with open(filepath, 'rb') as f:
+            data = tomllib.load(f)
+        logger.info(f'configuration: {Path(filepath).stem} loaded into memory')
+    except tomllib.TOMLDecodeError:
+        logger.error(f'Invalid TOML config: {filepath}')
+        data = None
+    # invalid files are cached too, they are retried once they change
+    _parsed[filepath] = (stamp, data)
+    return data
+
+
+def snapshot(dirpath) -> dict:
+    """(mtime, size) of each TOML file in a directory, used to detect changes"""
+    try:
+        with os.scandir(dirpath) as it:
+            return {
+                entry.path: (entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in it
+                if entry.name.endswith('.toml') and entry.is_file()
+            }
+    except OSError:
+        return {}
+
+
 if configpath := get_configpath():
-    filepaths = list(configpath.glob('*.toml'))
-    if any(f.stem in ('app', 'vban') for f in filepaths):
-        configs = {}
-        for filepath in filepaths:
-            filename = filepath.with_suffix('').stem
-            if filename in ('app', 'vban'):
-                try:
-                    with open(filepath, 'rb') as f:
-                        configs[filename] = tomllib.load(f)
-                    logger.info(f'configuration: {filename} loaded into memory')
-                except tomllib.TOMLDecodeError:
-                    logger.error(f'Invalid TOML config: configs/{filename.stem}')
-        configuration |= configs
+    for filename in ('app', 'vban'):
+        if (data := parse(configpath / f'{filename}.toml')) is not None:
+            configuration[filename] = data
 
 _defaults = {
     'configs': {
         'config': None,
+        'watch': 0,
     },
     'theme': {
         'enabled': True,
@@ -61,6 +93,30 @@ _defaults = {
         'default': 0,
     },
     'navigation': {'show': False},
+    'updates': {
+        'rate': 30,
+        'background_rate': 10,
+        'write_rate': 60,
+    },
+    'renderer': {
+        'mode': 'widgets',
+    },
+    'pool': {
+        'size': 4,
+    },
+    'standby': {
+        'enabled': False,
+        'size': 4,
+    },
+    'stats': {
+        'enabled': False,
+        'window': 500,
+    },
+    'watchdog': {
+        'enabled': False,
+        'threshold': 250,
+        'logfile': 'vmcompact-stalls.log',
+    },
 }
 
 
@@ -79,20 +135,70 @@ def get_configuration(key):
         return configuration[key]
 
 
-def loader(kind_id, target):
-    configs = {'reset': target.configs['reset']}
+def reload(filename):
+    """re-reads a top level config such as vban.toml, returns it if its contents changed"""
+    if configpath := get_configpath():
+        data = parse(configpath / f'{filename}.toml')
+        if data is not None and data != configuration.get(filename):
+            configuration[filename] = data
+            return data
+
+
+def get_profilepath(kind_id):
     if configpath := get_configpath():
-        userconfigpath = configpath / kind_id
-        if userconfigpath.exists():
-            filepaths = list(userconfigpath.glob('*.toml'))
-            for filepath in filepaths:
-                identifier = filepath.with_suffix('').stem
-                try:
-                    with open(filepath, 'rb') as f:
-                        configs[identifier] = tomllib.load(f)
-                    logger.info(f'loader: {identifier} loaded into memory')
-                except tomllib.TOMLDecodeError:
-                    logger.error(f'Invalid TOML config: configs/{filename.stem}')
-
-    target.configs = configs
+        return configpath / kind_id
+
+
+class Profiles(Mapping):
+    """
+    Profiles discovered by file name, each file is parsed on first access.
+
+    Names are kept sorted so they can be searched by prefix.
+    """
+
+    def __init__(self, defaults, filepaths):
+        self._defaults = defaults
+        self._filepaths = {
+            name: filepath
+            for name, filepath in filepaths.items()
+            if name not in defaults
+        }
+        self._names = sorted((*defaults, *self._filepaths), key=str.lower)
+        self._folded = [name.lower() for name in self._names]
+
+    def __getitem__(self, name):
+        if name in self._defaults:
+            return self._defaults[name]
+        if (data := parse(self._filepaths[name])) is None:
+            raise KeyError(name)
+        return data
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._defaults or name in self._filepaths
+
+    def search(self, prefix) -> list:
+        """names starting with prefix, case insensitive"""
+        prefix = prefix.lower()
+        i = bisect.bisect_left(self._folded, prefix)
+        j = bisect.bisect_left(self._folded, prefix + '\uffff')
+        return self._names[i:j]
+
+
+def loader(kind_id, target):
+    filepaths = {}
+    if (userconfigpath := get_profilepath(kind_id)) and userconfigpath.exists():
+        with os.scandir(userconfigpath) as it:
+            filepaths = {
+                entry.name.removesuffix('.toml'): Path(entry.path)
+                for entry in it
+                if entry.name.endswith('.toml') and entry.is_file()
+            }
+
+    target.configs = Profiles({'reset': target.configs['reset']}, filepaths)
     return target.configs
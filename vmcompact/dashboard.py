@@ -0,0 +1,250 @@
+import logging
+import threading
+import time
+import tkinter as tk
+from array import array
+from functools import partial
+
+from .data import _configuration
+from .levels import peaks, to_display
+from .sessions import connection_opts
+
+logger = logging.getLogger(__name__)
+
+# layout of a single host row
+ROW_HEIGHT = 30
+NAME_WIDTH = 110
+METER_WIDTH = 36
+METER_GAP = 8
+METER_TOP = 6
+METER_HEIGHT = 8
+# seconds before an unreachable host is retried, doubling up to RETRY_MAX
+RETRY_MIN = 2
+RETRY_MAX = 60
+
+
+class Host:
+    """Latest state of a single host, written by the poller and read by the dashboard"""
+
+    __slots__ = (
+        'name',
+        'connect',
+        'future',
+        'vban',
+        'offsets',
+        'state',
+        'levels',
+        'mutes',
+        'seq',
+        'retry',
+        'retry_at',
+    )
+
+    def __init__(self, name, connect):
+        self.name = name
+        self.connect = connect
+        self.future = connect()
+        self.vban = None
+        self.offsets = ()
+        self.state = 'connecting'
+        self.levels = ()
+        self.mutes = ()
+        self.seq = 0
+        self.retry = RETRY_MIN
+        self.retry_at = 0
+
+    def poll(self):
+        if self.vban is None:
+            if self.future is None:
+                if time.monotonic() < self.retry_at:
+                    return
+                self.future = self.connect()
+                self.state = 'connecting'
+                self.seq += 1
+                return
+            if not self.future.done():
+                return
+            if e := self.future.exception():
+                logger.debug(
+                    f'{self.name}: {type(e).__name__}: {e}, retrying in {self.retry}s'
+                )
+                self.state = 'unreachable'
+                self.future = None
+                self.retry_at = time.monotonic() + self.retry
+                self.retry = min(self.retry * 2, RETRY_MAX)
+                self.seq += 1
+                return
+            self.vban = self.future.result()
+            offsets, offset = [], 0
+            for bus in self.vban.bus:
+                offsets.append(offset)
+                offset += len(bus.levels.all)
+            self.offsets = offsets
+            self.state = 'connected'
+
+        levels = array('d')
+        for bus in self.vban.bus:
+            levels.extend(bus.levels.all)
+        mutes = tuple(bus.mute for bus in self.vban.bus)
+        levels = to_display(peaks(levels, self.offsets), [0] * len(self.offsets), mutes)
+        if levels != self.levels or mutes != self.mutes:
+            self.levels, self.mutes = levels, mutes
+            # bumped last, a reader sees either the previous or the new state
+            self.seq += 1
+
+
+class HostPoller(threading.Thread):
+    """Polls the bus levels and mutes of every host from a single thread"""
+
+    def __init__(self, hosts, rate):
+        super().__init__(name='vmcompact-dashboard', daemon=True)
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.hosts = hosts
+        self._interval = 1 / max(1, rate)
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.is_set():
+            for host in self.hosts:
+                try:
+                    host.poll()
+                except Exception as e:
+                    self.logger.error(f'{host.name}: {type(e).__name__}: {e}')
+            self._done.wait(self._interval)
+
+    def stop(self):
+        self._done.set()
+
+
+class Dashboard(tk.Toplevel):
+    """
+    Bus meters and mutes of every vban.toml connection, drawn on a single canvas.
+
+    Each connection gets its own session, one poller thread reads them all
+    and the canvas items of a host are only updated when its state changed.
+    """
+
+    def __init__(self, menu):
+        super().__init__(menu.parent)
+        self.menu = menu
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.title('VBAN Dashboard')
+        self.protocol('WM_DELETE_WINDOW', self.destroy)
+
+        vban_config = menu.vban_config
+        self.hosts = [
+            Host(
+                vban_config[f'connection-{i + 1}']['streamname'],
+                partial(
+                    menu.sessions.connect,
+                    *connection_opts(vban_config, i),
+                    background=True,
+                ),
+            )
+            for i, _ in enumerate(vban_config)
+        ]
+        self._drawn = [-1] * len(self.hosts)
+        self.items = [{} for _ in self.hosts]
+
+        self.canvas = tk.Canvas(
+            self,
+            width=NAME_WIDTH + 8 * (METER_WIDTH + METER_GAP),
+            height=ROW_HEIGHT * max(1, len(self.hosts)),
+            highlightthickness=0,
+        )
+        self.canvas.grid(column=0, row=0, sticky=(tk.N, tk.S, tk.W, tk.E))
+        for row, host in enumerate(self.hosts):
+            self.items[row]['state'] = self.canvas.create_text(
+                4,
+                row * ROW_HEIGHT + ROW_HEIGHT // 2,
+                anchor=tk.W,
+                text=f'{host.name} (connecting)',
+            )
+
+        self.poller = HostPoller(self.hosts, _configuration.update_rate)
+        self.poller.start()
+        self._frame_ms = max(1, round(1000 / max(1, _configuration.update_rate)))
+        self._draw_id = self.after(self._frame_ms, self.draw_step)
+
+    def draw_step(self):
+        for row, host in enumerate(self.hosts):
+            if host.seq != self._drawn[row]:
+                self._drawn[row] = host.seq
+                self.draw_host(row, host)
+        self._draw_id = self.after(self._frame_ms, self.draw_step)
+
+    def draw_host(self, row, host):
+        items = self.items[row]
+        top = row * ROW_HEIGHT
+        if host.state != 'connected':
+            self.canvas.itemconfigure(
+                items['state'], text=f'{host.name} ({host.state})'
+            )
+            return
+        if 'meters' not in items:
+            self.canvas.itemconfigure(items['state'], text=host.name)
+            self.create_meters(row, host)
+        drawn = items['drawn']
+        for i, state in enumerate(zip(host.levels, host.mutes)):
+            if i >= len(drawn) or state == drawn[i]:
+                continue
+            level, muted = state
+            x = NAME_WIDTH + i * (METER_WIDTH + METER_GAP)
+            self.canvas.coords(
+                items['meters'][i],
+                x,
+                top + METER_TOP,
+                x + METER_WIDTH * level / 72,
+                top + METER_TOP + METER_HEIGHT,
+            )
+            if muted != drawn[i][1]:
+                self.canvas.itemconfigure(
+                    items['frames'][i], outline='red' if muted else 'grey'
+                )
+            drawn[i] = state
+
+    def create_meters(self, row, host):
+        items = self.items[row]
+        top = row * ROW_HEIGHT
+        kind = host.vban.kind
+        names = [f'A{i + 1}' for i in range(kind.phys_out)] + [
+            f'B{i + 1}' for i in range(kind.virt_out)
+        ]
+        items['frames'], items['meters'] = [], []
+        items['drawn'] = [(0, False)] * len(names)
+        for i, name in enumerate(names):
+            x = NAME_WIDTH + i * (METER_WIDTH + METER_GAP)
+            items['frames'].append(
+                self.canvas.create_rectangle(
+                    x,
+                    top + METER_TOP,
+                    x + METER_WIDTH,
+                    top + METER_TOP + METER_HEIGHT,
+                    outline='grey',
+                )
+            )
+            items['meters'].append(
+                self.canvas.create_rectangle(
+                    x,
+                    top + METER_TOP,
+                    x,
+                    top + METER_TOP + METER_HEIGHT,
+                    fill='green',
+                    width=0,
+                )
+            )
+            self.canvas.create_text(
+                x + METER_WIDTH // 2,
+                top + METER_TOP + METER_HEIGHT + 8,
+                text=name,
+                font=('TkDefaultFont', 7),
+            )
+
+    def destroy(self):
+        self.after_cancel(self._draw_id)
+        self.poller.stop()
+        # a retry may be starting a connection, wait for the loop to end
+        self.poller.join(1)
+        [self.menu.sessions.discard(host.future) for host in self.hosts if host.future]
+        self.menu._dashboard = None
+        super().destroy()
@@ -1,7 +1,5 @@
 from dataclasses import dataclass
 
-from voicemeeterlib import kinds
-
 from .configurations import get_configuration
 
 configuration = get_configuration('app')
@@ -42,6 +40,35 @@ class Configurations(metaclass=SingletonMeta):
     # do we grid the navigation frame?
     navigation_show: bool = configuration['navigation']['show']
 
+    # max rate (Hz) at which dirty notifications are dispatched to observers
+    update_rate: int = configuration['updates']['rate']
+    # max rate (Hz) of level updates while the window is unfocused, 0 disables
+    background_rate: int = configuration['updates']['background_rate']
+    # max rate (Hz) at which queued parameter writes are sent to voicemeeter
+    write_rate: int = configuration['updates']['write_rate']
+
+    # draw channels as ttk widgets or on a single canvas
+    renderer: str = configuration['renderer']['mode']
+
+    # max number of hidden channel frames kept for reuse, 0 disables
+    pool_size: int = configuration['pool']['size']
+
+    # keep vban sessions logged in while idle, for the first standby_size connections
+    standby: bool = configuration['standby']['enabled']
+    standby_size: int = configuration['standby']['size']
+
+    # time observer callbacks from startup, p99 is taken over the last stats_window calls
+    stats: bool = configuration['stats']['enabled']
+    stats_window: int = configuration['stats']['window']
+
+    # log event loop stalls and Tk callbacks longer than watchdog_threshold (in ms)
+    watchdog: bool = configuration['watchdog']['enabled']
+    watchdog_threshold: int = configuration['watchdog']['threshold']
+    watchdog_logfile: str = configuration['watchdog']['logfile']
+
+    # interval (in seconds) at which the config directory is polled for changes, 0 disables
+    watch_interval: float = configuration['configs']['watch']
+
     @property
     def config(self):
         if 'configs' in configuration:
@@ -63,4 +90,6 @@ _configuration = Configurations()
 
 
 def kind_get(kind_id):
+    from voicemeeterlib import kinds
+
     return kinds.request_kind_map(kind_id)
@@ -1,18 +1,32 @@
+import logging
 import tkinter as tk
 from tkinter import ttk
 
-from . import builders
+from . import builders, util
 from .data import _base_values, _configuration
+from .levels import peaks, to_display
 
+logger = logging.getLogger(__name__)
 
-class GainLayer(ttk.LabelFrame):
+
+class GainLayer(util.CachedTarget, ttk.LabelFrame):
     """Concrete class representing a single gainlayer"""
 
+    # store fields synced while the strip is labelled
+    params = ('gain', 'on')
+
     def __init__(self, parent, index, j):
         super().__init__(parent)
         self.parent = parent
+        self.app = parent.parent
         self.index = index
         self.j = j
+        self.state = self.app.store.gainlayer[index][j]
+        self.strip_state = self.app.store.strip[index]
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.visible = True
+        self.built = False
+        self._level = 0
         self.styletable = self.parent.parent.styletable
         if index <= parent.phys_in:
             self.level_offset = index * 2
@@ -20,40 +34,51 @@ class GainLayer(ttk.LabelFrame):
             self.level_offset = parent.phys_in * 2 + (index - parent.phys_in) * 8
 
         self.builder = builders.ChannelLabelFrameBuilder(self, index, id='gainlayer')
-        self.builder.setup()
-        self.builder.add_progressbar()
-        self.builder.add_scale()
-        self.builder.add_gain_label()
-        self.builder.add_on_button()
-        self.sync_params()
-        self.sync_labels()
-        self.grid_configure()
+        self.subscribe()
 
-    @property
-    def target(self):
+    def resolve_target(self):
         """returns the strip[i].gainlayer class in the current interface"""
 
-        _target = self.parent.target
-        return _target.strip[self.index].gainlayer[self.j]
+        return self.parent.target.strip[self.index].gainlayer[self.j]
 
     @property
     def identifier(self):
         return 'gainlayer'
 
+    def build(self):
+        """builds the widgets and their variables, once the strip is labelled"""
+        if self.built:
+            return
+        self.builder.setup()
+        self.builder.add_progressbar()
+        self.builder.add_scale()
+        self.builder.add_gain_label()
+        self.builder.add_on_button()
+        self.grid_configure()
+        self.built = True
+
+    def release(self):
+        """destroys the widgets and their variables of an unlabelled gainlayer, hides it"""
+        self.builder.teardown()
+        self._level = 0
+        self.built = False
+
     def getter(self, param):
-        try:
-            return getattr(self.target, param)
-        except AttributeError as e:
-            self.logger(f'{type(e).__name__}: {e}')
+        target = self.target
+        if self.app.capabilities.supports(target, param):
+            return getattr(target, param)
+        self.logger.error(f'{type(target).__name__} does not support {param}')
 
     def setter(self, param, value):
-        if param in dir(self.target):  # avoid calling getattr (with hasattr)
-            setattr(self.target, param, value)
+        target = self.target
+        if self.app.capabilities.supports(target, param):
+            self.app.writer.put(target, param, value)
+            setattr(self.state, param, value)
 
     def reset_gain(self, *args):
         self.setter('gain', 0)
         self.gain.set(0)
-        self.gainlabel.set(self.gain.get())
+        self.gainlabel.set(0)
 
     def scale_callback(self, *args):
         """callback function for scale widget"""
@@ -91,88 +116,84 @@ class GainLayer(ttk.LabelFrame):
 
     def _on_mousewheel(self, event):
         _base_values.run_update = False
-        self.gain.set(
-            self.gain.get()
-            + (
-                _configuration.mwscroll_step
-                if event.delta > 0
-                else -_configuration.mwscroll_step
-            )
+        val = (self.state.gain or 0) + (
+            _configuration.mwscroll_step
+            if event.delta > 0
+            else -_configuration.mwscroll_step
         )
-        if self.gain.get() > 12:
-            self.gain.set(12)
-        elif self.gain.get() < -60:
-            self.gain.set(-60)
-        self.setter('gain', self.gain.get())
+        val = max(-60, min(12, val))
+        self.gain.set(val)
+        self.setter('gain', val)
         self.after(1, self.resume_updates)
 
     def set_on(self):
         """enables a gainlayer. sets its button colour"""
 
-        setattr(
+        self.app.writer.put(
             self.parent.target.strip[self.index],
             self.parent.buses[self.j],
             self.on.get(),
         )
+        self.state.on = self.on.get()
         if not _configuration.themes_enabled:
             self.styletable.configure(
                 f'{self.identifier}On{self.index}.TButton',
                 background=f'{"green" if self.on.get() else "white"}',
             )
 
-    def on_update(self, subject):
-        if subject == 'ldirty':
-            self.upd_levels()
-        elif subject == 'pdirty':
-            self.sync_params()
-        elif subject == 'labelframe':
-            self.after(5, self.sync_labels)
-
-    def sync_params(self):
-        self.gain.set(self.getter('gain'))
-        self.gainlabel.set(round(self.gain.get(), 1))
-        self.on.set(
-            getattr(
-                self.parent.target.strip[self.index],
-                self.parent.buses[self.j],
-            )
-        )
-        if not _configuration.themes_enabled:
-            self.styletable.configure(
-                f'{self.identifier}On{self.index}.TButton',
-                background=f'{"green" if self.on.get() else "white"}',
-            )
+    def subscribe(self):
+        """syncs the strip label now and whenever it changes, labelled gainlayers sync params"""
+        self.app.store.subscribe(self.strip_state, ('label',), self.on_state)
+
+    def unsubscribe(self):
+        self.app.store.unsubscribe(self.strip_state, ('label',), self.on_state)
+        self.app.store.unsubscribe(self.state, self.params, self.on_state)
+
+    def on_state(self, field, value):
+        """called by the store with the new value of a field"""
+        if field == 'label':
+            self.sync_labels(value)
+        elif field == 'gain':
+            self.gain.set(value)
+            self.gainlabel.set(round(value, 1))
+        elif field == 'on':
+            self.on.set(value)
+            if not _configuration.themes_enabled:
+                self.styletable.configure(
+                    f'{self.identifier}On{self.index}.TButton',
+                    background=f'{"green" if value else "white"}',
+                )
 
-    def sync_labels(self):
-        """sync params with voicemeeter"""
-        retval = self.parent.target.strip[self.index].label
-        if len(retval) > 10:
-            retval = f'{retval[:8]}..'
-        if not retval:
+    def sync_labels(self, label):
+        """sync labelframes according to the strip label"""
+        if len(label) > 10:
+            label = f'{label[:8]}..'
+        self.visible = bool(label)
+        if not label:
             self.parent.columnconfigure(self.index, minsize=0)
-            self.parent.parent.subject.remove(self)
-            self.grid_remove()
+            self.app.store.unsubscribe(self.state, self.params, self.on_state)
+            self.release()
         else:
-            self.parent.parent.subject.add(self)
+            self.build()
+            self.app.store.subscribe(self.state, self.params, self.on_state)
             self.grid()
-        self.configure(text=retval)
+        self.configure(text=label)
 
-    def upd_levels(self):
-        """
-        Updates level values.
-        """
-        if self.parent.target.strip[self.index].levels.is_updated:
-            val = max(self.parent.target.strip[self.index].levels.prefader)
-            # Convert dB to progressbar: -60dB=0, 0dB=60, +12dB=72
-            if (
-                self.parent.parent.strip_frame.strips[self.index].mute.get()
-                or not self.on.get()
-            ):
-                level_display = 0
-            else:
-                level_db = val + self.gain.get()
-                level_display = max(0, min(72, level_db + 60))
-            self.level.set(level_display)
+    @property
+    def level_gain(self):
+        return self.state.gain or 0
+
+    @property
+    def level_muted(self):
+        """a gainlayer meter reads 0 if its strip is muted or the layer is off"""
+        return (
+            self.parent.parent.strip_frame is not None and bool(self.strip_state.mute)
+        ) or not self.state.on
+
+    def set_level(self, val):
+        if val != self._level:
+            self._level = val
+            self.level.set(val)
 
     def grid_configure(self):
         self.grid(padx=_configuration.channel_xpadding, sticky=(tk.N, tk.S))
@@ -197,6 +218,9 @@ class GainLayer(ttk.LabelFrame):
 
 
 class SubMixFrame(ttk.Frame):
+    topics = ('ldirty',)
+    pool_key = None
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
@@ -209,24 +233,14 @@ class SubMixFrame(ttk.Frame):
         self.gainlayers = [
             GainLayer(self, index, _configuration.submixes) for index in range(8)
         ]
+        self.level_offsets = [gainlayer.level_offset for gainlayer in self.gainlayers]
         for i, labelframe in enumerate(self.labelframes):
             labelframe.grid(row=0, column=i)
-            if not self.target.strip[i].label:
+            if not labelframe.visible:
                 self.columnconfigure(i, minsize=0)
                 labelframe.grid_remove()
 
-        if _configuration.extends_horizontal:
-            self.grid(row=0, column=2)
-            if parent.bus_frame:
-                parent.bus_frame.grid_remove()
-        else:
-            if parent.bus_frame and parent.bus_frame.grid_info():
-                self.grid(
-                    row=parent.bus_frame.grid_info()['row'], column=0, sticky=(tk.W)
-                )
-                parent.bus_frame.grid_remove()
-            else:
-                self.grid(row=2, column=0, sticky=(tk.W))
+        self.place()
 
         self.grid_configure()
         """
@@ -234,7 +248,7 @@ class SubMixFrame(ttk.Frame):
         """
         for i, labelframe in enumerate(self.labelframes):
             labelframe.grid(row=0, column=i)
-            if not self.target.strip[i].label:
+            if not labelframe.visible:
                 self.columnconfigure(i, minsize=0)
                 labelframe.grid_remove()
 
@@ -246,6 +260,22 @@ class SubMixFrame(ttk.Frame):
 
         return self.parent.target
 
+    def place(self):
+        """grids the submix frame in place of the bus frame"""
+        parent = self.parent
+        if _configuration.extends_horizontal:
+            self.grid(row=0, column=2)
+            if parent.bus_frame:
+                parent.bus_frame.grid_remove()
+        else:
+            if parent.bus_frame and parent.bus_frame.grid_info():
+                self.grid(
+                    row=parent.bus_frame.grid_info()['row'], column=0, sticky=(tk.W)
+                )
+                parent.bus_frame.grid_remove()
+            else:
+                self.grid(row=2, column=0, sticky=(tk.W))
+
     @property
     def labelframes(self):
         """returns a tuple of current gainlayer labelframe addresses"""
@@ -257,9 +287,23 @@ class SubMixFrame(ttk.Frame):
         )
 
     def on_update(self, subject):
-        if subject == 'pdirty':
-            for labelframe in self.labelframes:
-                labelframe.on_update('labelframe')
+        if subject == 'ldirty':
+            self.upd_levels()
+
+    def upd_levels(self):
+        """
+        Updates the level meters of every visible gainlayer in a single pass.
+        """
+        if not (levels := self.parent.levels.strip):
+            return
+        display = to_display(
+            peaks(levels, self.level_offsets),
+            [gainlayer.level_gain for gainlayer in self.gainlayers],
+            [gainlayer.level_muted for gainlayer in self.gainlayers],
+        )
+        for gainlayer, val in zip(self.gainlayers, display):
+            if gainlayer.visible:
+                gainlayer.set_level(val)
 
     def grid_configure(self):
         [
@@ -271,8 +315,21 @@ class SubMixFrame(ttk.Frame):
             for i, _ in enumerate(self.labelframes)
         ]
 
-    def teardown(self):
-        # deregisters submixframe as pdirty observer
-        [self.parent.subject.remove(frame) for frame in self.gainlayers]
+    def hide(self):
+        """deregisters the submixframe and its gainlayers, then hides it"""
+        [gainlayer.unsubscribe() for gainlayer in self.gainlayers]
         self.parent.subject.remove(self)
-        self.destroy()
+        self.grid_remove()
+
+    def show(self):
+        """re-grids a pooled submixframe, re-registers it and syncs its gainlayers"""
+        self.place()
+        self.parent.subject.add(self)
+        [gainlayer.subscribe() for gainlayer in self.gainlayers]
+
+    def teardown(self):
+        """hides the submixframe, pooling it for reuse if the pool accepts it"""
+        self.hide()
+        if not self.parent.pool.release(self.pool_key, self):
+            self.destroy()
+        self.parent.submix_frame = None
@@ -1,9 +1,16 @@
-import voicemeeterlib
+import sys
 
-import vmcompact
+from vmcompact import startup
 
 
 def run():
+    if startup.FLAG in sys.argv:
+        startup.enable()
+
+    import voicemeeterlib
+
+    import vmcompact
+
     KIND_ID = 'potato'
 
     with voicemeeterlib.api(KIND_ID) as vmr:
@@ -0,0 +1,81 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class HealthMonitor(threading.Thread):
+    """
+    Probes the interface off the Tk thread.
+
+    While healthy the probe interval backs off from min_interval to max_interval,
+    suspect() resets it. After a failure probes run every min_interval,
+    the interface is ready again after settle consecutive successful probes.
+    Every change of state is passed to on_change (on this thread).
+    """
+
+    STARTING = 'starting'
+    READY = 'ready'
+    LOST = 'lost'
+
+    def __init__(self, probe, on_change, min_interval=0.5, max_interval=5, settle=3):
+        super().__init__(name='vmcompact-health', daemon=True)
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.probe = probe
+        self.on_change = on_change
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.settle = settle
+        self.state = self.STARTING
+        self._interval = min_interval
+        self._successes = 0
+        self._wake = threading.Event()
+        self._done = threading.Event()
+
+    @property
+    def healthy(self) -> bool:
+        return self.state != self.LOST
+
+    def run(self):
+        while not self._done.is_set():
+            self.step()
+            self._wake.wait(self._interval)
+            self._wake.clear()
+
+    def step(self):
+        try:
+            self.probe()
+        except Exception as e:
+            self.logger.debug(f'probe failed: {type(e).__name__}: {e}')
+            self._successes = 0
+            self._interval = self.min_interval
+            self.transition(self.LOST)
+            return
+
+        self._successes += 1
+        if self.state == self.READY:
+            self._interval = min(self._interval * 2, self.max_interval)
+        elif self._successes >= self.settle:
+            self.transition(self.READY)
+
+    def transition(self, state):
+        if state != self.state:
+            self.logger.info(f'interface {self.state} -> {state}')
+            self.state = state
+            self.on_change(state)
+
+    def suspect(self):
+        """something looks wrong, probe now and keep probing at min_interval"""
+        self._interval = self.min_interval
+        self._wake.set()
+
+    def expect_restart(self):
+        """the interface is restarting, wait for it to settle before it is ready"""
+        self._successes = 0
+        self._interval = self.min_interval
+        self.state = self.STARTING
+        self._wake.set()
+
+    def stop(self):
+        self._done.set()
+        self._wake.set()
@@ -0,0 +1,73 @@
+import logging
+from array import array
+from functools import cache
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def numpy():
+    """returns numpy if installed, imported on first use to keep it out of startup"""
+    try:
+        import numpy
+    except ModuleNotFoundError:
+        return None
+    return numpy
+
+
+def peaks(levels, offsets):
+    """
+    Returns the peak level of each channel.
+
+    levels is a flat array of dB values, offsets the index of each channel's first level.
+    """
+    if (np := numpy()) is not None:
+        return np.maximum.reduceat(np.asarray(levels), offsets)
+    bounds = (*offsets, len(levels))
+    return array('d', (max(levels[a:b]) for a, b in zip(bounds, bounds[1:])))
+
+
+def to_display(peaks, gains, muted):
+    """
+    Maps peak levels to progressbar values.
+
+    Convert dB to progressbar: -60dB=0, 0dB=60, +12dB=72.
+    Muted channels and channels below -72dB read 0.
+    """
+    if (np := numpy()) is not None:
+        peaks = np.asarray(peaks)
+        vals = np.clip(peaks + np.asarray(gains) + 60, 0, 72)
+        vals[(peaks < -72) | np.asarray(muted, dtype=bool)] = 0
+        return vals.tolist()
+    return [
+        0 if val < -72 or mute else max(0, min(72, val + gain + 60))
+        for val, gain, mute in zip(peaks, gains, muted)
+    ]
+
+
+class LevelPipeline:
+    """Reads the level arrays of the current interface once per tick"""
+
+    def __init__(self, app):
+        self.app = app
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.strip = array('d')
+        self.bus = array('d')
+
+    def refresh(self):
+        """
+        Reads the strip and bus level arrays needed by the current frames.
+
+        Channel levels are concatenated so a channel's level_offset indexes its first level.
+        """
+        target = self.app.target
+        if self.app.strip_frame or self.app.submix_frame:
+            self.strip = self._read(target.strip, 'prefader')
+        if self.app.bus_frame:
+            self.bus = self._read(target.bus, 'all')
+
+    def _read(self, channels, mode):
+        levels = array('d')
+        for channel in channels:
+            levels.extend(getattr(channel.levels, mode))
+        return levels
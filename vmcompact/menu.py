@@ -1,17 +1,21 @@
 import logging
+import time
 import tkinter as tk
-import webbrowser
 from functools import partial
 from tkinter import messagebox
 
-import sv_ttk
-import vban_cmd
-from vban_cmd.error import VBANCMDConnectionError
-
+from . import recall
+from .configurations import reload
 from .data import _base_values, _configuration, get_configuration, kind_get
+from .sessions import Sessions, connection_opts
 
 logger = logging.getLogger(__name__)
 
+# above this many profiles the Load config menu is grouped by first letter
+PROFILES_PER_MENU = 20
+# seconds after which opening the VBAN menu probes the connections again
+PROBE_INTERVAL = 30
+
 
 class Menus(tk.Menu):
     def __init__(self, parent, vmr):
@@ -85,18 +89,8 @@ class Menus(tk.Menu):
         self.menu_configs_load = tk.Menu(self.menu_configs, tearoff=0)
         self.menu_configs.add_cascade(menu=self.menu_configs_load, label='Load config')
         self.config_defaults = {'reset'}
-        if len(self.parent.userconfigs) > len(self.config_defaults) and all(
-            key in self.parent.userconfigs for key in self.config_defaults
-        ):
-            [
-                self.menu_configs_load.add_command(
-                    label=profile, command=partial(self.load_profile, profile)
-                )
-                for profile in self.parent.userconfigs.keys()
-                if profile not in self.config_defaults
-            ]
-        else:
-            self.menu_configs.entryconfig(0, state='disabled')
+        self._search = None
+        self.menu_setup()
         self.menu_configs.add_command(
             label='Reset to defaults', command=self.load_defaults
         )
@@ -179,13 +173,22 @@ class Menus(tk.Menu):
         # vban connect menu
         self.menu_vban = tk.Menu(self, tearoff=0)
         self.add_cascade(menu=self.menu_vban, label='VBAN')
+        self.sessions = Sessions(
+            standby=_configuration.standby_size if _configuration.standby else 0
+        )
+        self.vban = None
+        self._vban_status = {}
+        self._vban_probed = 0
+        self._connecting = None
+        self._connected = None
+        self._dashboard = None
         if self.vban_config:
             for i, _ in enumerate(self.vban_config):
                 setattr(self, f'menu_vban_{i + 1}', tk.Menu(self.menu_vban, tearoff=0))
                 target_menu = getattr(self, f'menu_vban_{i + 1}')
                 self.menu_vban.add_cascade(
                     menu=target_menu,
-                    label=f'{self.vban_config[f"connection-{i + 1}"]["streamname"]}',
+                    label=self.vban_label(i),
                     underline=0,
                 )
                 target_menu.add_command(
@@ -194,7 +197,18 @@ class Menus(tk.Menu):
                 target_menu.add_command(
                     label='Disconnect', command=partial(self.vban_disconnect, i)
                 )
+                target_menu.add_command(label='Cancel', command=self.vban_cancel)
                 target_menu.entryconfig(1, state='disabled')
+                target_menu.entryconfig(2, state='disabled')
+            self.menu_vban.add_separator()
+            self.menu_vban.add_command(
+                label='Probe connections', command=self.probe_connections
+            )
+            self.menu_vban.add_command(label='Dashboard', command=self.show_dashboard)
+            # probe on open, at most every PROBE_INTERVAL seconds
+            self.menu_vban.configure(postcommand=self.probe_connections_due)
+            self.after(1, self.probe_connections)
+            self.after(1, self.sessions.warm, self.vban_config)
         else:
             self.entryconfig(4, state='disabled')
 
@@ -239,15 +253,28 @@ class Menus(tk.Menu):
 
     def load_custom_profile(self, profile):
         self.logger.info(f'loading user profile {profile}')
-        self.target.apply(profile)
-        if not _base_values.run_update:
-            self.parent.subject.notify('pdirty')
+        self.apply_changes(profile)
 
     def load_profile(self, profile):
         self.logger.info(f'loading user profile {profile}')
-        self.target.apply_config(profile)
-        if not _base_values.run_update:
-            self.parent.subject.notify('pdirty')
+        try:
+            config = recall.resolve(self.target.configs, profile)
+        except (KeyError, ValueError) as e:
+            self.logger.error(f'unable to load profile {profile}: {e}')
+            return
+        self.apply_changes(config)
+
+    def apply_changes(self, config):
+        """sends only the parameters that differ, UI sync is paused until they are sent"""
+        changes = recall.diff(self.target, self.parent.capabilities, config)
+        if not changes:
+            self.logger.debug('profile already applied, nothing to send')
+            return
+        self.logger.debug(f'sending changes for {", ".join(changes)}')
+        self.parent.profile_started()
+        self.parent.writer.submit(
+            self.target.apply, changes, done=self.parent.profile_applied
+        )
 
     def load_defaults(self):
         msg = (
@@ -283,6 +310,8 @@ class Menus(tk.Menu):
             self.parent.subject.notify('submix')
 
     def load_theme(self, theme):
+        import sv_ttk
+
         sv_ttk.set_theme(theme)
         _configuration.theme_mode = theme
         self.menu_themes.entryconfig(
@@ -300,6 +329,10 @@ class Menus(tk.Menu):
         ]
         self.menu_lock.config(bg=f'{"black" if theme == "dark" else "white"}')
         self.menu_configs_load.config(bg=f'{"black" if theme == "dark" else "white"}')
+        [
+            menu.config(bg=f'{"black" if theme == "dark" else "white"}')
+            for menu in self.menu_configs_load.winfo_children()
+        ]
         [
             menu.config(bg=f'{"black" if theme == "dark" else "white"}')
             for menu in self.menu_vban.winfo_children()
@@ -315,14 +348,7 @@ class Menus(tk.Menu):
         )
 
     def menu_teardown(self, i):
-        # remove config load menus
-        if len(self.parent.userconfigs) > len(self.config_defaults):
-            for profile in self.parent.userconfigs:
-                if profile not in self.config_defaults:
-                    try:
-                        self.menu_configs_load.delete(profile)
-                    except tk._tkinter.tclError as e:
-                        self.logger.warning(f'{type(e).__name__}: {e}')
+        self.clear_profiles()
 
         [
             self.menu_vban.entryconfig(j, state='disabled')
@@ -331,15 +357,90 @@ class Menus(tk.Menu):
         ]
 
     def menu_setup(self):
-        if len(self.parent.userconfigs) > len(self.config_defaults):
-            for profile in self.parent.userconfigs:
-                if profile not in self.config_defaults:
-                    self.menu_configs_load.add_command(
-                        label=profile, command=partial(self.load_profile, profile)
-                    )
-                    self.menu_configs.entryconfig(0, state='normal')
-        else:
+        profiles = [
+            profile
+            for profile in self.parent.userconfigs
+            if profile not in self.config_defaults
+        ]
+        if not profiles:
             self.menu_configs.entryconfig(0, state='disabled')
+            return
+
+        if len(profiles) <= PROFILES_PER_MENU:
+            self.populate_profiles(self.menu_configs_load, profiles)
+        else:
+            self.menu_configs_load.add_command(
+                label='Search...', command=self.search_profiles
+            )
+            self.menu_configs_load.add_separator()
+            groups = {}
+            for profile in profiles:
+                group = profile[0].upper() if profile[0].isalnum() else '#'
+                groups.setdefault(group, []).append(profile)
+            for group, names in groups.items():
+                submenu = tk.Menu(
+                    self.menu_configs_load,
+                    tearoff=0,
+                    bg=self.menu_configs_load.cget('bg'),
+                )
+                # entries are only created once the submenu is first opened
+                submenu.configure(
+                    postcommand=partial(self.populate_profiles, submenu, names)
+                )
+                self.menu_configs_load.add_cascade(
+                    menu=submenu, label=f'{group} ({len(names)})'
+                )
+        self.menu_configs.entryconfig(0, state='normal')
+
+    def populate_profiles(self, menu, profiles):
+        if menu.index('end') is None:
+            [
+                menu.add_command(
+                    label=profile, command=partial(self.load_profile, profile)
+                )
+                for profile in profiles
+            ]
+
+    def clear_profiles(self):
+        """removes every profile entry and group from the Load config menu"""
+        self.menu_configs_load.delete(0, 'end')
+        [menu.destroy() for menu in self.menu_configs_load.winfo_children()]
+        if self._search is not None:
+            self._search.destroy()
+
+    def search_profiles(self):
+        from .search import ProfileSearch
+
+        if self._search is None:
+            self._search = ProfileSearch(self)
+        self._search.lift()
+        self._search.entry.focus_set()
+
+    def reload_profiles(self):
+        """rebuilds the Load config menu from the profiles on disk"""
+        self.clear_profiles()
+        if 'userconfigs' in self.parent.__dict__:
+            del self.parent.__dict__['userconfigs']
+        self.menu_setup()
+
+    def reload_configs(self):
+        """applies edits to vban.toml, app.toml is only read on startup"""
+        if (vban_config := reload('vban')) is None:
+            return
+        if not self.vban_config or vban_config.keys() != self.vban_config.keys():
+            self.logger.warning(
+                'vban.toml connections added or removed, restart to update the VBAN menu'
+            )
+            return
+        self.vban_config = vban_config
+        [
+            self.menu_vban.entryconfig(i, label=self.vban_label(i))
+            for i, _ in enumerate(self.vban_config)
+        ]
+        self.logger.info('vban.toml reloaded')
+        self.sessions.clear_standby()
+        self.sessions.warm(self.vban_config, skip=self._connected)
+        self.probe_connections()
 
     def toggle_navigation(self, cmd=None):
         if cmd == 'show':
@@ -353,19 +454,95 @@ class Menus(tk.Menu):
             self._navigation_hide.set(True)
             self._navigation_show.set(not self._navigation_hide.get())
 
+    def vban_label(self, i):
+        label = self.vban_config[f'connection-{i + 1}']['streamname']
+        if status := self._vban_status.get(i):
+            return f'{label} ({status})'
+        return label
+
+    def set_vban_status(self, i, status):
+        self._vban_status[i] = status
+        self.menu_vban.entryconfig(i, label=self.vban_label(i))
+
+    def probe_connections_due(self):
+        if time.monotonic() - self._vban_probed > PROBE_INTERVAL:
+            self.probe_connections()
+
+    def probe_connections(self):
+        """probes every connection concurrently, results are shown in the VBAN menu"""
+        self._vban_probed = time.monotonic()
+        futures = self.sessions.probe_all(self.vban_config)
+        self.after(50, self.probe_step, futures)
+
+    def probe_step(self, futures):
+        for i, future in list(futures.items()):
+            if not future.done():
+                continue
+            del futures[i]
+            if i >= len(self.vban_config) or i == self._connecting:
+                continue
+            if self._vban_status.get(i) == 'connected':
+                continue
+            if e := future.exception():
+                self.logger.debug(f'probe of connection-{i + 1} failed: {e}')
+                self.set_vban_status(i, 'unreachable')
+            else:
+                self.set_vban_status(i, f'{future.result() * 1000:.0f} ms')
+        if futures:
+            self.after(50, self.probe_step, futures)
+
+    def show_dashboard(self):
+        from .dashboard import Dashboard
+
+        if self._dashboard is None:
+            self._dashboard = Dashboard(self)
+        self._dashboard.lift()
+
     def vban_connect(self, i):
-        opts = {}
-        opts |= self.vban_config[f'connection-{i + 1}']
-        kind_id = opts.pop('kind')
-        if 'ip' in opts:
-            opts['host'] = opts.pop('ip')
-        self.vban = vban_cmd.api(kind_id, **opts)
-        # login to vban interface
-        try:
+        kind_id, opts = connection_opts(self.vban_config, i)
+        self._connecting = i
+        if future := self.sessions.take(i):
+            self.logger.info(f'Using standby vban connection to {opts.get("host")}')
+            self._connect_future = future
+        else:
             self.logger.info(f'Attempting vban connection to {opts.get("host")}')
-            self.vban.login()
-        except VBANCMDConnectionError as e:
-            self.vban.logout()
+            self._connect_future = self.sessions.connect(kind_id, opts)
+        [
+            self.menu_vban.entryconfig(j, state='disabled')
+            for j, _ in enumerate(self.menu_vban.winfo_children())
+            if j != i
+        ]
+        target_menu = getattr(self, f'menu_vban_{i + 1}')
+        target_menu.entryconfig(0, state='disabled')
+        target_menu.entryconfig(2, state='normal')
+        self.after(1, self.vban_connect_step, i, kind_id, opts, time.monotonic())
+
+    def vban_cancel(self):
+        if self._connecting is not None:
+            i, self._connecting = self._connecting, None
+            self.logger.info(f'vban connection to connection-{i + 1} cancelled')
+            self.sessions.discard(self._connect_future)
+            self.vban_connect_reset(i)
+
+    def vban_connect_reset(self, i):
+        target_menu = getattr(self, f'menu_vban_{i + 1}')
+        target_menu.entryconfig(0, state='normal')
+        target_menu.entryconfig(2, state='disabled')
+        self.set_vban_status(i, '')
+        self.after(1, self.enable_vban_menus)
+
+    def vban_connect_step(self, i, kind_id, opts, started):
+        """polls the login running on a worker thread, showing its progress"""
+        if self._connecting != i:
+            return
+        if not self._connect_future.done():
+            self.set_vban_status(i, f'connecting {time.monotonic() - started:.0f}s')
+            self.after(250, self.vban_connect_step, i, kind_id, opts, started)
+            return
+
+        self._connecting = None
+        if e := self._connect_future.exception():
+            self.vban_connect_reset(i)
             msg = (
                 f'Timeout attempting to establish connection to {opts.get("host")}',
                 'Please check your connection settings',
@@ -373,19 +550,30 @@ class Menus(tk.Menu):
             messagebox.showerror('Connection Error', '\n'.join(msg))
             msg = (str(e), 'resuming local connection')
             self.logger.error(', '.join(msg))
-            self.after(1, self.enable_vban_menus)
             return
+        previous, self.vban = self.vban, self._connect_future.result()
+        target_menu = getattr(self, f'menu_vban_{i + 1}')
+        target_menu.entryconfig(2, state='disabled')
+        self.set_vban_status(i, 'connected')
         self.menu_teardown(i)
         self.vban.event.add(['pdirty', 'ldirty'])
-        # destroy the current App frames
-        self.parent._destroy_top_level_frames()
-        _base_values.vban_connected = True
-        self.vmr.end_thread()
-
-        # build new app frames according to a kind
         kind = kind_get(kind_id)
-        self.parent.build_app(kind, self.vban)
-        target_menu = getattr(self, f'menu_vban_{i + 1}')
+        if self._connected is not None:
+            # switching hosts, the previous session is parked or logged out
+            self.vban_release(self._connected, previous)
+        else:
+            self.vmr.end_thread()
+        self._connected = i
+
+        if kind == self.parent.kind:
+            # same kind of Voicemeeter, keep the frames and rebind them
+            self.parent.rebind(self.vban)
+        else:
+            # destroy the current App frames
+            self.parent._destroy_top_level_frames()
+            _base_values.vban_connected = True
+            # build new app frames according to a kind
+            self.parent.build_app(kind, self.vban)
         target_menu.entryconfig(0, state='disabled')
         target_menu.entryconfig(1, state='normal')
         self.menu_layout.entryconfig(
@@ -397,16 +585,31 @@ class Menus(tk.Menu):
         if 'userconfigs' in self.parent.__dict__:
             del self.parent.__dict__['userconfigs']
         self.menu_setup()
+        if self.sessions.standby:
+            # other hosts may be switched to directly
+            self.after(1, self.enable_vban_menus)
+
+    def vban_release(self, i, vban):
+        """parks a session for reuse if standby is enabled, otherwise logs out"""
+        if not self.sessions.park(i, vban):
+            vban.logout()
+        target_menu = getattr(self, f'menu_vban_{i + 1}')
+        target_menu.entryconfig(0, state='normal')
+        target_menu.entryconfig(1, state='disabled')
+        self.set_vban_status(i, '')
 
     def vban_disconnect(self, i):
         self.menu_teardown(i)
+        self.set_vban_status(i, '')
+        self._connected = None
 
         # destroy the current App frames
         self.parent._destroy_top_level_frames()
         _base_values.vban_connected = False
         # logout of vban interface
         self.vmr.init_thread()
-        self.vban.logout()
+        self.vban_release(i, self.vban)
+        self.vban = None
         # build new app frames according to a kind
         kind = kind_get(self.vmr.type)
         self.parent.build_app(kind)
@@ -426,10 +629,16 @@ class Menus(tk.Menu):
         self.after(50, self.enable_vban_menus)
 
     def documentation(self):
+        import webbrowser
+
         webbrowser.open_new(r'https://voicemeeter.com/')
 
     def github(self):
+        import webbrowser
+
         webbrowser.open_new(r'https://github.com/onyx-and-iris/voicemeeter-compact')
 
     def onyxandiris(self):
+        import webbrowser
+
         webbrowser.open_new(r'https://onyxandiris.online')
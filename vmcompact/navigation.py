@@ -4,7 +4,7 @@ from tkinter import ttk
 
 from . import builders
 from .data import _configuration
-from .gainlayer import SubMixFrame
+from .stats import NotifyStats
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +28,12 @@ class Navigation(ttk.Frame):
         self.builder.grid_configure()
 
         self.mainframebuilder = builders.MainFrameBuilder(self.parent)
+        self._stats_id = None
+        self._showing_value = False
 
     def show_submix(self):
         if self.submix.get():
-            self.parent.submix_frame = SubMixFrame(self.parent)
-            self.logger.info(
-                f'Finished building submixframe for submix {_configuration.submixes}'
-            )
+            self.mainframebuilder.create_submixframe()
         else:
             if _configuration.extends_horizontal:
                 self.parent.submix_frame.teardown()
@@ -97,3 +96,54 @@ class Navigation(ttk.Frame):
                     )
 
         self.extend_text.set('REDUCE' if self.extend.get() else 'EXTEND')
+
+    def toggle_info(self):
+        """
+        Shows the observer with the slowest p99 on the INFO button while it is on.
+
+        Turning it off logs the timings of every observer.
+        """
+        subject = self.parent.subject
+        if self.info.get():
+            if subject.stats is None:
+                subject.stats = NotifyStats(_configuration.stats_window)
+            self.show_stats()
+            return
+
+        if self._stats_id:
+            self.after_cancel(self._stats_id)
+            self._stats_id = None
+        if subject.stats is not None:
+            self.logger.info(f'observer timings:\n{subject.stats.report()}')
+            if not _configuration.stats:
+                subject.stats = None
+        if not self._showing_value:
+            self.info_text.set('')
+
+    def show_stats(self):
+        self.update_stats()
+        self._stats_id = self.after(1000, self.show_stats)
+
+    def update_stats(self):
+        """stats are suspended while a config slider value is shown"""
+        if self._showing_value:
+            return
+        if slowest := self.parent.subject.stats.slowest():
+            name, topic, timing = slowest
+            self.info_text.set(f'{name[:10]} {timing.p99 * 1000:.1f}ms')
+
+    def show_value(self, val):
+        """shows the value of the hovered config slider"""
+        self._showing_value = True
+        self.info_text.set(val)
+
+    def clear_value(self):
+        self._showing_value = False
+        self.info_text.set('')
+        if self._stats_id:
+            self.update_stats()
+
+    def destroy(self):
+        if self._stats_id:
+            self.after_cancel(self._stats_id)
+        super().destroy()
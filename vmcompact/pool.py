@@ -0,0 +1,44 @@
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class FramePool:
+    """
+    Keeps torn down channel/submix frames hidden for reuse.
+
+    Frames are keyed by (kind, identifier, submix), at most size frames are kept,
+    the least recently released frame is destroyed first.
+    """
+
+    def __init__(self, size):
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.size = size
+        self._frames = OrderedDict()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def acquire(self, key):
+        """returns a pooled frame for key, or None"""
+        if frame := self._frames.pop(key, None):
+            self.logger.debug(f'reusing frame {key}')
+        return frame
+
+    def release(self, key, frame) -> bool:
+        """pools a hidden frame, returns False if pooling is disabled"""
+        if self.size <= 0:
+            return False
+        if stale := self._frames.pop(key, None):
+            stale.destroy()
+        self._frames[key] = frame
+        while len(self._frames) > self.size:
+            evicted_key, evicted = self._frames.popitem(last=False)
+            self.logger.debug(f'evicting frame {evicted_key}')
+            evicted.destroy()
+        return True
+
+    def clear(self):
+        """forgets every pooled frame, they are destroyed along with the app frames"""
+        self._frames.clear()
@@ -0,0 +1,83 @@
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+
+def resolve(configs, name, seen=()) -> dict:
+    """returns a profile merged with any profiles it extends"""
+    if name in seen:
+        raise ValueError(f'profile {name} extends itself')
+    config = configs[name]
+    if 'extends' not in config:
+        return config
+    base = resolve(configs, config['extends'], (*seen, name))
+    return {k: v for k, v in merge(base, config).items() if k != 'extends'}
+
+
+def merge(base, config) -> dict:
+    merged = dict(base)
+    for k, v in config.items():
+        if isinstance(v, dict) and isinstance(merged.get(k), dict):
+            merged[k] = merge(merged[k], v)
+        else:
+            merged[k] = v
+    return merged
+
+
+def diff(target, capabilities, config) -> dict:
+    """
+    Returns the parts of a profile that differ from the current state.
+
+    Strips come before buses, each in index order.
+    Tables other than strip-N/bus-N are passed through unchanged.
+    """
+    changes = {}
+    for key in sorted(config, key=_order):
+        params = config[key]
+        match key.split('-'):
+            case ['strip' | 'bus' as kls, index] if index.isnumeric():
+                channels = getattr(target, kls)
+                if int(index) < len(channels):
+                    params = _diff(channels[int(index)], capabilities, params)
+        if params:
+            changes[key] = params
+    return changes
+
+
+def _order(key):
+    match key.split('-'):
+        case ['strip' | 'bus' as kls, index] if index.isnumeric():
+            return (kls != 'strip', kls, int(index))
+    return (True, key, 0)
+
+
+def _diff(obj, capabilities, params) -> dict:
+    changed = {}
+    for param, value in params.items():
+        # unsupported params are left to apply(), which logs them
+        if not capabilities.supports(obj, param):
+            changed[param] = value
+            continue
+        try:
+            if isinstance(value, dict):
+                if nested := _diff(getattr(obj, param), capabilities, value):
+                    changed[param] = nested
+            elif param == 'mode':
+                if obj.mode.get() != value:
+                    changed[param] = value
+            elif not _equal(getattr(obj, param), value):
+                changed[param] = value
+        except Exception as e:
+            logger.debug(f'unable to read {param}: {type(e).__name__}: {e}')
+            changed[param] = value
+    return changed
+
+
+def _equal(current, value) -> bool:
+    if isinstance(value, float) or isinstance(current, float):
+        try:
+            return math.isclose(current, value, abs_tol=0.01)
+        except TypeError:
+            return False
+    return current == value
@@ -0,0 +1,57 @@
+import logging
+import tkinter as tk
+from tkinter import ttk
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileSearch(tk.Toplevel):
+    """Finds a profile by name prefix, Enter or double click loads the selection"""
+
+    def __init__(self, menu):
+        super().__init__(menu.parent)
+        self.menu = menu
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.title('Load config')
+        self.transient(menu.parent)
+        self.protocol('WM_DELETE_WINDOW', self.destroy)
+
+        self.prefix = tk.StringVar()
+        self.prefix.trace_add('write', self.on_search)
+        self.entry = ttk.Entry(self, textvariable=self.prefix)
+        self.entry.grid(column=0, row=0, sticky=(tk.W, tk.E))
+        self.listbox = tk.Listbox(self, height=15, activestyle='dotbox')
+        self.listbox.grid(column=0, row=1, sticky=(tk.N, tk.S, tk.W, tk.E))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        self.entry.bind('<Return>', self.on_select)
+        self.entry.bind('<Down>', lambda e: self.listbox.focus_set())
+        self.listbox.bind('<Return>', self.on_select)
+        self.listbox.bind('<Double-Button-1>', self.on_select)
+        self.bind('<Escape>', lambda e: self.destroy())
+        self.on_search()
+
+    @property
+    def profiles(self) -> list:
+        return [
+            profile
+            for profile in self.menu.parent.userconfigs.search(self.prefix.get())
+            if profile not in self.menu.config_defaults
+        ]
+
+    def on_search(self, *args):
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, *self.profiles)
+        if self.listbox.size():
+            self.listbox.selection_set(0)
+
+    def on_select(self, *args):
+        if selection := self.listbox.curselection():
+            profile = self.listbox.get(selection[0])
+            self.destroy()
+            self.menu.load_profile(profile)
+
+    def destroy(self):
+        self.menu._search = None
+        super().destroy()
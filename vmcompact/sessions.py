@@ -0,0 +1,122 @@
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def connection_opts(vban_config, i) -> tuple:
+    """returns (kind_id, opts) for [connection-i+1]"""
+    opts = dict(vban_config[f'connection-{i + 1}'])
+    kind_id = opts.pop('kind')
+    if 'ip' in opts:
+        opts['host'] = opts.pop('ip')
+    return kind_id, opts
+
+
+def login(kind_id, opts):
+    """creates a vban interface and logs in, blocks until connected or timed out"""
+    import vban_cmd
+
+    vban = vban_cmd.api(kind_id, **opts)
+    try:
+        vban.login()
+    except Exception:
+        vban.logout()
+        raise
+    return vban
+
+
+def probe(kind_id, opts, timeout=2) -> float:
+    """round trip time (in seconds) of a login/logout, raises if unreachable"""
+    import vban_cmd
+
+    start = time.perf_counter()
+    vban = vban_cmd.api(
+        kind_id, **(opts | {'timeout': timeout, 'disable_rt_listeners': True})
+    )
+    try:
+        vban.login()
+        return time.perf_counter() - start
+    finally:
+        vban.logout()
+
+
+class Sessions:
+    """
+    Runs VBAN logins and reachability probes on worker threads.
+
+    With standby > 0 the first standby connections are kept logged in while idle,
+    so switching to one of them skips the login.
+    Idle sessions keep receiving RT packets but have their events removed.
+    Connects started by the user have their own workers, so they never wait
+    behind probes, standby logins or dashboard retries of unreachable hosts.
+    """
+
+    def __init__(self, standby=0, max_workers=8):
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.standby = standby
+        self._standby = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix='vmcompact-vban'
+        )
+        self._connects = ThreadPoolExecutor(2, thread_name_prefix='vmcompact-connect')
+
+    def connect(self, kind_id, opts, background=False):
+        """returns a Future resolving to a logged in vban interface"""
+        executor = self._executor if background else self._connects
+        return executor.submit(login, kind_id, opts)
+
+    def probe_all(self, vban_config) -> dict:
+        """probes every connection concurrently, returns {index: Future}"""
+        return {
+            i: self._executor.submit(probe, *connection_opts(vban_config, i))
+            for i, _ in enumerate(vban_config)
+        }
+
+    def discard(self, future):
+        """logs out of a connection that is no longer wanted once it completes"""
+
+        def logout(future):
+            if not future.cancelled() and future.exception() is None:
+                self.logger.debug('logging out of discarded vban session')
+                future.result().logout()
+
+        future.add_done_callback(logout)
+
+    def warm(self, vban_config, skip=None):
+        """logs in to the standby connections that are not already pooled"""
+        for i, _ in zip(range(self.standby), vban_config):
+            if i != skip and i not in self._standby:
+                self.logger.debug(f'warming standby session connection-{i + 1}')
+                self._standby[i] = self.connect(
+                    *connection_opts(vban_config, i), background=True
+                )
+
+    def take(self, i):
+        """returns a Future of a pooled session (possibly still logging in), or None"""
+        if (future := self._standby.pop(i, None)) is None:
+            return
+        if future.done() and (future.exception() or future.result().stopped()):
+            self.discard(future)
+            return
+        return future
+
+    def park(self, i, vban) -> bool:
+        """pools a session no longer in use, returns False if it isn't a standby"""
+        if i >= self.standby or i in self._standby:
+            return False
+        vban.event.remove(['pdirty', 'ldirty'])
+        future = Future()
+        future.set_result(vban)
+        self._standby[i] = future
+        return True
+
+    def clear_standby(self):
+        """logs out of every pooled session"""
+        [self.discard(future) for future in self._standby.values()]
+        self._standby.clear()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._connects.shutdown(wait=False, cancel_futures=True)
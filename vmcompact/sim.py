@@ -0,0 +1,491 @@
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+BUS_MODES = (
+    'normal',
+    'amix',
+    'bmix',
+    'repeat',
+    'composite',
+    'tvmix',
+    'upmix21',
+    'upmix41',
+    'upmix61',
+    'centeronly',
+    'lfeonly',
+    'rearonly',
+)
+
+
+@dataclass(frozen=True)
+class Kind:
+    """The parts of a voicemeeterlib kind map used by the app"""
+
+    name: str
+    ins: tuple
+    outs: tuple
+
+    @property
+    def phys_in(self) -> int:
+        return self.ins[0]
+
+    @property
+    def virt_in(self) -> int:
+        return self.ins[-1]
+
+    @property
+    def phys_out(self) -> int:
+        return self.outs[0]
+
+    @property
+    def virt_out(self) -> int:
+        return self.outs[-1]
+
+    @property
+    def num_strip(self) -> int:
+        return sum(self.ins)
+
+    @property
+    def num_bus(self) -> int:
+        return sum(self.outs)
+
+    def __str__(self) -> str:
+        return self.name.capitalize()
+
+
+kinds = {
+    'basic': Kind('basic', (2, 1), (1, 1)),
+    'banana': Kind('banana', (3, 2), (3, 2)),
+    'potato': Kind('potato', (5, 3), (5, 3)),
+}
+
+
+class Subject:
+    """Notifies callbacks named on_<event>, as voicemeeterlib does"""
+
+    def __init__(self):
+        self.observers = []
+
+    def add(self, observer):
+        for o in observer if isinstance(observer, (list, tuple)) else (observer,):
+            if o not in self.observers:
+                self.observers.append(o)
+
+    def remove(self, observer):
+        for o in observer if isinstance(observer, (list, tuple)) else (observer,):
+            if o in self.observers:
+                self.observers.remove(o)
+
+    def notify(self, event):
+        for o in tuple(self.observers):
+            if hasattr(o, 'on_update'):
+                o.on_update(event)
+            elif o.__name__ == f'on_{event}':
+                o()
+
+
+class Event:
+    """Keeps track of event subscriptions"""
+
+    def __init__(self):
+        self.subs = {'pdirty': False, 'ldirty': False}
+
+    @property
+    def pdirty(self) -> bool:
+        return self.subs['pdirty']
+
+    @property
+    def ldirty(self) -> bool:
+        return self.subs['ldirty']
+
+    def add(self, events):
+        for event in (events,) if isinstance(events, str) else events:
+            self.subs[event] = True
+
+    def remove(self, events):
+        for event in (events,) if isinstance(events, str) else events:
+            self.subs[event] = False
+
+    def get(self) -> list:
+        return [k for k, v in self.subs.items() if v]
+
+    def any(self) -> bool:
+        return any(self.subs.values())
+
+
+class Param:
+    """A simulated parameter, reads and writes cost the configured latency"""
+
+    def __init__(self, default):
+        self.default = default
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        obj._remote.wait()
+        return obj._values.get(self.name, self.default)
+
+    def __set__(self, obj, value):
+        obj._remote.wait()
+        obj._values[self.name] = value
+        obj._remote.mark_dirty()
+
+
+class ModeParam:
+    """A bus mode flag, setting one clears the others"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.get() == self.name
+
+    def __set__(self, obj, value):
+        obj._remote.wait()
+        obj._values['mode'] = self.name if value else 'normal'
+        obj._remote.mark_dirty()
+
+
+class Node:
+    """Base class for simulated strips, buses and their nested parameters"""
+
+    def __init__(self, remote, index):
+        self._remote = remote
+        self._values = {}
+        self.index = index
+
+    def apply(self, data):
+        for attr, val in data.items():
+            if isinstance(val, dict):
+                getattr(self, attr).apply(val)
+            elif attr == 'mode':
+                setattr(self.mode, val, True)
+            elif attr in dir(self):
+                setattr(self, attr, val)
+            else:
+                logger.error(f'invalid attribute {attr} for {type(self).__name__}')
+        return self
+
+
+class Knob(Node):
+    knob = Param(0.0)
+
+
+class EQ(Node):
+    on = Param(False)
+    ab = Param(False)
+
+
+class BusMode(Node):
+    def get(self) -> str:
+        self._remote.wait()
+        return self._values.get('mode', 'normal')
+
+
+class GainLayer(Node):
+    gain = Param(0.0)
+    on = Param(False)
+
+
+class Levels:
+    """Level values (in dB) generated from the remote's waveform"""
+
+    def __init__(self, remote, offset, channels):
+        self._remote = remote
+        self._offset = offset
+        self._channels = channels
+
+    def _levels(self):
+        return tuple(
+            self._remote.level(self._offset + i) for i in range(self._channels)
+        )
+
+    prefader = postfader = postmute = all = property(_levels)
+
+
+class Strip(Node):
+    label = Param('')
+    gain = Param(0.0)
+    mute = Param(False)
+    mono = Param(False)
+    solo = Param(False)
+    limit = Param(12)
+
+
+class Bus(Node):
+    label = Param('')
+    gain = Param(0.0)
+    mute = Param(False)
+    mono = Param(0)
+
+
+def _make_classes(kind):
+    """strip and bus classes of a kind, so every kind has its own set of params"""
+    routing = {
+        **{f'A{i + 1}': Param(False) for i in range(kind.phys_out)},
+        **{f'B{i + 1}': Param(False) for i in range(kind.virt_out)},
+    }
+    virtual = {'mc': Param(False)} if kind.name != 'basic' else {}
+    basic = {'audibility': Param(0.0)} if kind.name == 'basic' else {}
+    return (
+        type(f'{kind}PhysicalStrip', (Strip,), routing | basic),
+        type(f'{kind}VirtualStrip', (Strip,), routing | virtual),
+        type(
+            f'{kind}BusMode',
+            (BusMode,),
+            {mode: ModeParam() for mode in BUS_MODES},
+        ),
+    )
+
+
+class Gui:
+    launched_by_api = False
+
+
+class Command:
+    def __init__(self, remote):
+        self._remote = remote
+        self._lock = False
+
+    def show(self):
+        logger.info('show')
+
+    def hide(self):
+        logger.info('hide')
+
+    def restart(self):
+        logger.info('restart')
+
+    def shutdown(self):
+        logger.info('shutdown')
+
+    @property
+    def lock(self):
+        return self._lock
+
+    @lock.setter
+    def lock(self, val):
+        self._lock = val
+
+
+class Remote:
+    """
+    An in-process stand-in for a voicemeeterlib remote, for benchmarks and offline work.
+
+    pdirty_rate: parameter changes per second made as if by another client
+    ldirty_rate: level updates per second
+    latency: seconds added to every parameter read and write
+    waveform: 'sine', 'noise', 'square' or 'silence'
+    """
+
+    DELAY = 0.001
+
+    def __init__(
+        self,
+        kind_id,
+        pdirty_rate=0,
+        ldirty_rate=30,
+        latency=0,
+        waveform='sine',
+        labels=True,
+        seed=None,
+    ):
+        self.kind = kinds[kind_id]
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.pdirty_rate = pdirty_rate
+        self.ldirty_rate = ldirty_rate
+        self.latency = latency
+        self.waveform = waveform
+        self.subject = Subject()
+        self.event = Event()
+        self.gui = Gui()
+        self.command = Command(self)
+        self.stop_event = None
+        self._random = random.Random(seed)
+        self._pdirty = False
+        self._started = time.perf_counter()
+        # parameter calls (reads and writes) and writes, read by benchmarks
+        self.calls = self.writes = 0
+
+        physical, virtual, busmode = _make_classes(self.kind)
+        strips, offset = [], 0
+        for i in range(self.kind.num_strip):
+            is_physical = i < self.kind.phys_in
+            strip = (physical if is_physical else virtual)(self, i)
+            channels = 2 if is_physical else 8
+            strip.levels = Levels(self, offset, channels)
+            offset += channels
+            if is_physical and self.kind.name != 'basic':
+                strip.comp = Knob(self, i)
+                strip.gate = Knob(self, i)
+                strip.denoiser = Knob(self, i)
+            if self.kind.name != 'basic':
+                strip.gainlayer = tuple(
+                    GainLayer(self, j) for j in range(self.kind.num_bus)
+                )
+            strip.eq = EQ(self, i)
+            strips.append(strip)
+        self.strip = tuple(strips)
+        buses = []
+        for i in range(self.kind.num_bus):
+            bus = Bus(self, i)
+            bus.levels = Levels(self, offset, 8)
+            offset += 8
+            bus.eq = EQ(self, i)
+            bus.mode = busmode(self, i)
+            buses.append(bus)
+        self.bus = tuple(buses)
+        self._phases = [self._random.random() * math.tau for _ in range(offset)]
+
+        if labels:
+            [
+                strip._values.update(label=f'Strip {i}')
+                for i, strip in enumerate(self.strip)
+            ]
+            [bus._values.update(label=f'Bus {i}') for i, bus in enumerate(self.bus)]
+        self.configs = {'reset': self.reset_profile()}
+
+    def __str__(self):
+        return f'Simulated Voicemeeter {self.kind}'
+
+    def __enter__(self):
+        self.login()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.end_thread()
+        self.logout()
+
+    def login(self):
+        self.logger.info(f'{self} logged in')
+
+    def logout(self):
+        self.logger.info(f'{self} logged out')
+
+    @property
+    def version(self) -> str:
+        return '0.0.0.0'
+
+    @property
+    def type(self) -> str:
+        return self.kind.name
+
+    def wait(self):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def mark_dirty(self):
+        self.writes += 1
+        self._pdirty = True
+
+    def clear_dirty(self):
+        self._pdirty = False
+
+    def level(self, i) -> float:
+        t = time.perf_counter() - self._started
+        match self.waveform:
+            case 'sine':
+                return -30 + 30 * math.sin(2 * math.pi * 0.5 * t + self._phases[i])
+            case 'square':
+                return 0.0 if math.sin(2 * math.pi * t + self._phases[i]) > 0 else -60
+            case 'noise':
+                return self._random.uniform(-60, 0)
+        return -200.0
+
+    def reset_profile(self) -> dict:
+        """the profile voicemeeterlib builds for Reset to defaults"""
+        profile = {}
+        for i, strip in enumerate(self.strip):
+            is_physical = i < self.kind.phys_in
+            profile[f'strip-{i}'] = {
+                'mute': False,
+                'mono': False,
+                'solo': False,
+                'gain': 0.0,
+                **{
+                    f'A{j + 1}': not is_physical and j == 0
+                    for j in range(self.kind.phys_out)
+                },
+                **{
+                    f'B{j + 1}': is_physical and j == 0
+                    for j in range(self.kind.virt_out)
+                },
+            }
+        for i, _ in enumerate(self.bus):
+            profile[f'bus-{i}'] = {
+                'mono': 0,
+                'eq': {'on': False},
+                'mute': False,
+                'gain': 0.0,
+            }
+        return profile
+
+    def apply(self, data):
+        for key, params in data.items():
+            kls, index = key.split('-')
+            getattr(self, kls)[int(index)].apply(params)
+            time.sleep(self.DELAY)
+
+    def apply_config(self, name):
+        config = self.configs[name]
+        if 'extends' in config:
+            base = self.configs[config['extends']]
+            config = {
+                key: base.get(key, {}) | config.get(key, {})
+                for key in (*base, *config)
+                if key != 'extends'
+            }
+        self.apply(config)
+        self.logger.info(f"Profile '{name}' applied!")
+
+    def run_voicemeeter(self, kind_id):
+        self.logger.info(f'run_voicemeeter {kind_id}')
+
+    def init_thread(self):
+        self.stop_event = threading.Event()
+        threading.Thread(target=self._produce, name='sim-events', daemon=True).start()
+
+    def end_thread(self):
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    def stopped(self) -> bool:
+        return self.stop_event is None or self.stop_event.is_set()
+
+    def _produce(self):
+        """the event thread, mirrors the voicemeeterlib producer at its 33ms rate limit"""
+        stop_event = self.stop_event
+        next_level = next_change = time.perf_counter()
+        # rates are read every tick so they may be changed while running
+        while not stop_event.wait(
+            min(0.033, 1 / self.ldirty_rate) if self.ldirty_rate else 0.033
+        ):
+            now = time.perf_counter()
+            if self.pdirty_rate and now >= next_change:
+                next_change = now + 1 / self.pdirty_rate
+                channel = self._random.choice(self.strip + self.bus)
+                channel._values['gain'] = round(self._random.uniform(-60, 12), 1)
+                self._pdirty = True
+            if self._pdirty and self.event.pdirty:
+                self._pdirty = False
+                self.subject.notify('pdirty')
+            if self.ldirty_rate and self.event.ldirty and now >= next_level:
+                next_level = now + 1 / self.ldirty_rate
+                self.subject.notify('ldirty')
+
+
+def api(kind_id, **kwargs) -> Remote:
+    """returns a simulated remote, use it with vmcompact.connect() as a voicemeeterlib remote"""
+    return Remote(kind_id, **kwargs)
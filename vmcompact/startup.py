@@ -0,0 +1,115 @@
+import logging
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from importlib.abc import MetaPathFinder
+
+logger = logging.getLogger(__name__)
+
+FLAG = '--startup-profile'
+
+_profiler = None
+
+
+class _TimedLoader:
+    """Wraps a module loader, timing exec_module"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        stack = self._profiler._stack
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            # (cumulative, self) seconds
+            self._profiler.imports[module.__name__] = (elapsed, elapsed - nested)
+
+
+class StartupProfiler(MetaPathFinder):
+    """
+    Records import times per module and build times per step.
+
+    Enabled by passing --startup-profile to a gui entry point,
+    the report is written to stderr once the first frame has been drawn.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports = {}
+        self.steps = []
+        self._stack = []
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            if spec := finder.find_spec(fullname, path, target):
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    @contextmanager
+    def measure(self, step):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((step, time.perf_counter() - start))
+
+    def report(self, limit=25) -> str:
+        lines = [
+            f'startup profile: first paint after {time.perf_counter() - self.started:.3f}s',
+            f'{"cumulative":>10} {"self":>10}  import',
+        ]
+        for name, (cumulative, own) in sorted(
+            self.imports.items(), key=lambda item: item[1][0], reverse=True
+        )[:limit]:
+            lines.append(f'{cumulative * 1000:>8.1f}ms {own * 1000:>8.1f}ms  {name}')
+        lines.append(f'{"elapsed":>10}  build step')
+        for step, elapsed in self.steps:
+            lines.append(f'{elapsed * 1000:>8.1f}ms  {step}')
+        return '\n'.join(lines)
+
+
+def enable():
+    """starts recording imports, call before importing the app"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+        sys.meta_path.insert(0, _profiler)
+    return _profiler
+
+
+def enabled() -> bool:
+    return _profiler is not None
+
+
+def measure(step):
+    """context manager timing a build step, a no-op unless profiling is enabled"""
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.measure(step)
+
+
+def report():
+    """writes the report to stderr and stops recording imports"""
+    if _profiler is None:
+        return
+    if _profiler in sys.meta_path:
+        sys.meta_path.remove(_profiler)
+    print(_profiler.report(), file=sys.stderr)
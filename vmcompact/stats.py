@@ -0,0 +1,82 @@
+from collections import deque
+
+
+class Timing:
+    """Call count and total time, p99 over the last window calls"""
+
+    __slots__ = ('count', 'total', 'recent')
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.recent.append(elapsed)
+
+    @property
+    def p99(self) -> float:
+        if not self.recent:
+            return 0.0
+        recent = sorted(self.recent)
+        return recent[min(len(recent) - 1, int(len(recent) * 0.99))]
+
+
+class NotifyStats:
+    """
+    Timings of Subject.notify callbacks per observer class and topic, and per topic.
+
+    Set as Subject.stats to start recording.
+    """
+
+    def __init__(self, window=500):
+        self.window = window
+        self.observers = {}
+        self.topics = {}
+
+    def record(self, topic, observer, elapsed):
+        key = (type(observer).__name__, topic)
+        if (timing := self.observers.get(key)) is None:
+            timing = self.observers[key] = Timing(self.window)
+        timing.add(elapsed)
+        if (timing := self.topics.get(topic)) is None:
+            timing = self.topics[topic] = Timing(self.window)
+        timing.add(elapsed)
+
+    def slowest(self):
+        """returns (observer class name, topic, timing) of the slowest p99, or None"""
+        if self.observers:
+            (name, topic), timing = max(
+                self.observers.items(), key=lambda item: item[1].p99
+            )
+            return name, topic, timing
+
+    def report(self) -> str:
+        """a table of every observer and topic, by total time"""
+        rows = [
+            (name, topic, timing)
+            for (name, topic), timing in sorted(
+                self.observers.items(), key=lambda item: -item[1].total
+            )
+        ]
+        rows += [
+            ('*', topic, timing)
+            for topic, timing in sorted(
+                self.topics.items(), key=lambda item: -item[1].total
+            )
+        ]
+        lines = [
+            f'{"observer":<28}{"topic":<12}{"calls":>8}{"total ms":>12}{"mean ms":>10}{"p99 ms":>10}'
+        ]
+        for name, topic, timing in rows:
+            lines.append(
+                f'{name:<28}{topic!s:<12}{timing.count:>8}{timing.total * 1000:>12.1f}'
+                f'{timing.total * 1000 / timing.count:>10.3f}{timing.p99 * 1000:>10.3f}'
+            )
+        return '\n'.join(lines)
+
+    def clear(self):
+        self.observers.clear()
+        self.topics.clear()
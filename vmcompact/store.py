@@ -0,0 +1,203 @@
+import logging
+
+from . import util
+
+logger = logging.getLogger(__name__)
+
+
+class Record:
+    """Base class for a store record, subclasses locate each field on the interface"""
+
+    __slots__ = ()
+
+    def read(self, target, field):
+        obj, attr = self.locate(target, field)
+        return getattr(obj, attr)
+
+    def pending(self, writer, target, field) -> bool:
+        """True while a write of field is queued, the interface holds the previous value"""
+        return writer.pending(*self.locate(target, field))
+
+
+class ChannelState(Record):
+    """Last known state of a strip or bus, None until read"""
+
+    __slots__ = ('index', 'label', 'gain', 'mute')
+
+    def __init__(self, index):
+        self.index = index
+        self.clear()
+
+    def clear(self):
+        self.label = self.gain = self.mute = None
+
+    def locate(self, target, field):
+        """returns the interface object and attribute holding field"""
+        return self.source(target), field
+
+
+class StripState(ChannelState):
+    __slots__ = ()
+
+    def source(self, target):
+        return target.strip[self.index]
+
+
+class BusState(ChannelState):
+    __slots__ = ()
+
+    def source(self, target):
+        return target.bus[self.index]
+
+
+class GainLayerState(Record):
+    """Last known state of strip[index].gainlayer[j], on is the strip's routing to bus j"""
+
+    __slots__ = ('index', 'j', 'bus', 'gain', 'on')
+
+    def __init__(self, index, j, bus):
+        self.index = index
+        self.j = j
+        self.bus = bus
+        self.clear()
+
+    def clear(self):
+        self.gain = self.on = None
+
+    def locate(self, target, field):
+        strip = target.strip[self.index]
+        if field == 'on':
+            return strip, self.bus
+        return strip.gainlayer[self.j], field
+
+
+class ParamState(Record):
+    """Last known value of a config frame parameter, dotted params such as comp.knob are resolved"""
+
+    __slots__ = ('kls', 'index', 'param', 'value')
+
+    def __init__(self, kls, index, param):
+        self.kls = kls
+        self.index = index
+        self.param = param
+        self.clear()
+
+    def clear(self):
+        self.value = None
+
+    def locate(self, target, field):
+        obj = getattr(target, self.kls)[self.index]
+        *path, attr = self.param.split('.')
+        for p in path:
+            obj = getattr(obj, p)
+        return obj, attr
+
+
+class BusModeState(Record):
+    """Last known mode of bus[index], written by setting one of modes to True"""
+
+    __slots__ = ('index', 'modes', 'value')
+
+    def __init__(self, index, modes):
+        self.index = index
+        self.modes = modes
+        self.clear()
+
+    def clear(self):
+        self.value = None
+
+    def read(self, target, field):
+        return target.bus[self.index].mode.get()
+
+    def pending(self, writer, target, field) -> bool:
+        mode = target.bus[self.index].mode
+        return any(writer.pending(mode, name) for name in self.modes)
+
+
+class Store:
+    """
+    Python side copy of the channel and config frame state shown by the frames.
+
+    Frames subscribe to the fields they display. refresh() reads the subscribed
+    fields from the interface in a single pass per pdirty and calls the subscribers
+    of each field that changed. Hot paths read the records rather than Tk variables.
+    Fields with a write queued on the writer keep their local value until it is sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.strip = ()
+        self.bus = ()
+        self.gainlayer = ()
+        self.bus_mode = ()
+        self._params = {}
+        self._subscribers = {}
+
+    def build(self, kind):
+        """creates the records of a kind, dropping every subscription"""
+        self._subscribers.clear()
+        self._params.clear()
+        buses = tuple(f'A{i + 1}' for i in range(kind.phys_out)) + tuple(
+            f'B{i + 1}' for i in range(kind.virt_out)
+        )
+        modes = tuple(util.get_busmode_shortnames(kind))
+        self.strip = tuple(StripState(i) for i in range(kind.num_strip))
+        self.bus = tuple(BusState(i) for i in range(kind.num_bus))
+        self.gainlayer = tuple(
+            tuple(GainLayerState(i, j, bus) for j, bus in enumerate(buses))
+            for i in range(kind.num_strip)
+        )
+        self.bus_mode = tuple(BusModeState(i, modes) for i in range(kind.num_bus))
+
+    def param(self, kls, index, param) -> ParamState:
+        """returns the record of a config frame parameter, created on first use"""
+        key = (kls, index, param)
+        if (record := self._params.get(key)) is None:
+            record = self._params[key] = ParamState(kls, index, param)
+        return record
+
+    def invalidate(self):
+        """forgets every value, subscribers are called on the next refresh"""
+        [record.clear() for record in (*self.strip, *self.bus, *self.bus_mode)]
+        [record.clear() for records in self.gainlayer for record in records]
+        [record.clear() for record in self._params.values()]
+
+    def subscribe(self, record, fields, callback):
+        """calls callback(field, value) now and whenever a field of record changes"""
+        target, writer = self.app.target, self.app.writer
+        for field in fields:
+            callbacks = self._subscribers.setdefault((record, field), {})
+            # unwatched fields may be stale, unless a write of them is queued
+            if getattr(record, field) is None or (
+                not callbacks and not record.pending(writer, target, field)
+            ):
+                setattr(record, field, record.read(target, field))
+            callbacks[callback] = None
+            callback(field, getattr(record, field))
+
+    def unsubscribe(self, record, fields, callback):
+        for field in fields:
+            if callbacks := self._subscribers.get((record, field)):
+                callbacks.pop(callback, None)
+                if not callbacks:
+                    del self._subscribers[(record, field)]
+
+    def refresh(self):
+        """reads every subscribed field, calls the subscribers of those that changed"""
+        target, writer = self.app.target, self.app.writer
+        for (record, field), callbacks in tuple(self._subscribers.items()):
+            if record.pending(writer, target, field):
+                # the interface still holds the previous value
+                continue
+            value = record.read(target, field)
+            if value != getattr(record, field):
+                setattr(record, field, value)
+                # a callback may unsubscribe others
+                for callback in tuple(callbacks):
+                    if callback in callbacks:
+                        callback(field, value)
+
+    def clear(self):
+        """drops every subscription"""
+        self._subscribers.clear()
@@ -1,34 +1,62 @@
-class Subject:
-    """Adds support for observers"""
+import time
+import weakref
 
-    def __init__(self):
-        """list of current observers"""
 
-        self._observers = list()
+class Subject:
+    """Adds support for observers, indexed by topic"""
 
-    def notify(self, modifier=None):
-        """run callbacks on update"""
+    def __init__(self, weak=False):
+        """ordered sets of current observers, keyed by topic"""
 
-        [o.on_update(modifier) for o in self._observers]
+        self._weak = weak
+        self._observers = dict()
+        # a NotifyStats, times every callback while set
+        self.stats = None
 
-    def add(self, observer):
-        """adds an observer to _observers"""
+    def _registry(self):
+        return weakref.WeakKeyDictionary() if self._weak else dict()
 
-        if observer not in self._observers:
-            self._observers.append(observer)
+    def notify(self, modifier=None):
+        """run callbacks for the observers of a topic"""
+
+        if observers := self._observers.get(modifier):
+            if self.stats is None:
+                for o in tuple(observers):
+                    o.on_update(modifier)
+                return
+            for o in tuple(observers):
+                start = time.perf_counter()
+                o.on_update(modifier)
+                self.stats.record(modifier, o, time.perf_counter() - start)
+
+    def add(self, observer, topics=None):
+        """
+        adds an observer to _observers
+
+        if no topics are given the observer's own topics attribute is used
+        """
+
+        for topic in topics or observer.topics:
+            if topic not in self._observers:
+                self._observers[topic] = self._registry()
+            self._observers[topic][observer] = None
 
     def remove(self, observer):
         """removes an observer from _observers"""
 
-        if observer in self._observers:
-            self._observers.remove(observer)
+        for observers in self._observers.values():
+            observers.pop(observer, None)
 
     def get(self) -> list:
         """returns the current _observers"""
 
-        return self._observers
+        return list(
+            dict.fromkeys(
+                o for observers in self._observers.values() for o in observers
+            )
+        )
 
     def clear(self):
-        """clears the _observers list"""
+        """clears the _observers registry"""
 
         self._observers.clear()
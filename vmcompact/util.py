@@ -1,3 +1,20 @@
+class CachedTarget:
+    """
+    Caches the interface object a channel or frame resolves to.
+
+    The handle is re-resolved whenever App.target_generation changes.
+    """
+
+    _generation = None
+
+    @property
+    def target(self):
+        if self._generation != self.app.target_generation:
+            self._target = self.resolve_target()
+            self._generation = self.app.target_generation
+        return self._target
+
+
 def get_busmode_fullnames(kind) -> dict:
     if kind.name == 'basic':
         return {
@@ -0,0 +1,149 @@
+import functools
+import logging
+import sys
+import threading
+import time
+import tkinter as tk
+import traceback
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from .configurations import get_configpath
+
+logger = logging.getLogger(__name__)
+
+# seconds between heartbeats scheduled on the Tk thread
+HEARTBEAT = 0.1
+
+
+def describe(func) -> str:
+    """a readable name for a Tk callback"""
+    if isinstance(func, functools.partial):
+        return describe(func.func)
+    if (owner := getattr(func, '__self__', None)) is not None:
+        return f'{type(owner).__name__}.{func.__name__}'
+    return getattr(func, '__name__', repr(func))
+
+
+def get_logpath(logfile) -> Path:
+    """relative paths are kept in the config directory, or the working directory"""
+    logpath = Path(logfile).expanduser()
+    if logpath.is_absolute():
+        return logpath
+    return (get_configpath() or Path.cwd()) / logpath
+
+
+class Watchdog(threading.Thread):
+    """
+    Detects stalls of the Tk event loop.
+
+    A heartbeat scheduled with after() measures how late it runs. While it is
+    overdue by more than threshold this thread samples the stack of the Tk thread
+    and the callback it is running. Every Tk callback is timed, slow ones are logged.
+    Stalls and slow callbacks are written to a rotating log file.
+    """
+
+    def __init__(self, app, threshold, logfile, max_bytes=1_000_000, backups=3):
+        super().__init__(name='vmcompact-watchdog', daemon=True)
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.app = app
+        self.threshold = threshold
+        self.logfile = get_logpath(logfile)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.current = None
+        self._handler = None
+        self._callwrapper = None
+        self._tk_ident = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._sampled = False
+        self._done = threading.Event()
+
+    def install(self):
+        """times every Tk callback registered from now on, call before building widgets"""
+        if self._callwrapper is not None:
+            return
+        self._callwrapper = tk.CallWrapper
+        watchdog = self
+
+        class CallWrapper(self._callwrapper):
+            def __call__(self, *args):
+                # callbacks registered before stop() are no longer timed
+                if watchdog._callwrapper is None:
+                    return super().__call__(*args)
+                previous, watchdog.current = watchdog.current, self.func
+                start = time.perf_counter()
+                try:
+                    return super().__call__(*args)
+                finally:
+                    watchdog.current = previous
+                    if (elapsed := time.perf_counter() - start) > watchdog.threshold:
+                        watchdog.slow(self.func, elapsed)
+
+        tk.CallWrapper = CallWrapper
+
+    def start(self):
+        """attaches the log file and starts the heartbeat, call from the Tk thread"""
+        try:
+            self.logfile.parent.mkdir(parents=True, exist_ok=True)
+            self._handler = RotatingFileHandler(
+                self.logfile,
+                maxBytes=self.max_bytes,
+                backupCount=self.backups,
+                encoding='utf-8',
+            )
+        except OSError as e:
+            self.logger.error(f'unable to open {self.logfile}: {e}')
+        else:
+            self._handler.setFormatter(
+                logging.Formatter('%(asctime)s %(levelname)s %(message)s')
+            )
+            logger.addHandler(self._handler)
+        self.logger.info(
+            f'watching for stalls over {self.threshold * 1000:.0f}ms, logging to {self.logfile}'
+        )
+        self._tk_ident = threading.get_ident()
+        self._beat = time.perf_counter()
+        self.app.after(round(HEARTBEAT * 1000), self.beat)
+        super().start()
+
+    def beat(self):
+        now = time.perf_counter()
+        if (late := now - self._beat - HEARTBEAT) > self.threshold:
+            self.logger.warning(f'event loop stalled for {late * 1000:.0f}ms')
+        self._beat = now
+        self._sampled = False
+        if not self._done.is_set():
+            self.app.after(round(HEARTBEAT * 1000), self.beat)
+
+    def slow(self, func, elapsed):
+        self.logger.warning(
+            f'slow callback {describe(func)} took {elapsed * 1000:.0f}ms'
+        )
+
+    def run(self):
+        while not self._done.wait(HEARTBEAT):
+            late = time.perf_counter() - self._beat - HEARTBEAT
+            if late > self.threshold and not self._sampled:
+                self._sampled = True
+                self.sample(late)
+
+    def sample(self, late):
+        """logs what the Tk thread is doing, once per stall"""
+        if (frame := sys._current_frames().get(self._tk_ident)) is None:
+            return
+        current = describe(self.current) if self.current else 'no callback'
+        self.logger.warning(
+            f'event loop stalled for {late * 1000:.0f}ms so far, in {current}:\n'
+            + ''.join(traceback.format_stack(frame))
+        )
+
+    def stop(self):
+        """stops the heartbeat, callbacks registered from now on are no longer timed"""
+        if self._callwrapper is not None:
+            tk.CallWrapper = self._callwrapper
+            self._callwrapper = None
+        self._done.set()
+        if self._handler:
+            logger.removeHandler(self._handler)
+            self._handler.close()
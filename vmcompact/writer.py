@@ -0,0 +1,88 @@
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class Writer(threading.Thread):
+    """
+    Writes parameters to the interface off the Tk thread.
+
+    Writes are queued per (target, param), the latest value wins.
+    A write stays pending until it has been sent, see pending().
+    The queue is flushed at most rate times per second.
+    Calls submitted with submit() run in order after the pending writes.
+    Failed writes and calls are logged and reported to on_error.
+    """
+
+    def __init__(self, rate, on_error=None):
+        super().__init__(name='vmcompact-writer', daemon=True)
+        self.logger = logger.getChild(self.__class__.__name__)
+        self._interval = 1 / max(1, rate)
+        self.on_error = on_error
+        self._pending = {}
+        self._calls = deque()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._done = threading.Event()
+
+    def put(self, target, param, value):
+        """queues a write, replacing any pending write of the same parameter"""
+        key = (id(target), param)
+        with self._lock:
+            self._pending.pop(key, None)
+            self._pending[key] = (target, param, value)
+        self._wake.set()
+
+    def pending(self, target, param) -> bool:
+        """True until the latest queued write of param has been sent"""
+        return (id(target), param) in self._pending
+
+    def submit(self, fn, *args, done=None):
+        """queues a call, done is called (on this thread) once it returns"""
+        self._calls.append((fn, args, done))
+        self._wake.set()
+
+    def run(self):
+        while not self._done.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            self.flush()
+            self._done.wait(self._interval)
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            pending = tuple(self._pending.items())
+        for key, write in pending:
+            target, param, value = write
+            try:
+                setattr(target, param, value)
+            except Exception as e:
+                self.error(e)
+            with self._lock:
+                # unless a newer value was queued while writing
+                if self._pending.get(key) is write:
+                    del self._pending[key]
+        while self._calls:
+            fn, args, done = self._calls.popleft()
+            try:
+                fn(*args)
+            except Exception as e:
+                self.error(e)
+            finally:
+                if done:
+                    done()
+
+    def error(self, e):
+        self.logger.error(f'{type(e).__name__}: {e}')
+        if self.on_error:
+            self.on_error()
+
+    def stop(self, timeout=1):
+        """stops the thread after flushing any pending writes"""
+        self._done.set()
+        self._wake.set()
+        if self.is_alive():
+            self.join(timeout)